@@ -5,15 +5,133 @@ Generate Benchmark Analysis Plots
 Create comprehensive visualizations of benchmark results
 """
 
+import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
 from process_results import ResultsProcessor
 
+# Plot methods run by generate_all(); each writes one independent PNG
+PLOT_METHODS = (
+    'plot_throughput_comparison',
+    'plot_latency_distribution',
+    'plot_program_type_comparison',
+    'plot_data_mechanism_comparison',
+    'plot_language_performance_heatmap',
+    'plot_cpu_usage_analysis',
+    'plot_duration_comparison',
+)
+
+# Static parts of the HTML report, around the generated-at line
+REPORT_HTML_HEADER = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>eBPF Benchmark Report</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 20px;
+            border-radius: 5px;
+            box-shadow: 0 0 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #007bff;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #555;
+            margin-top: 30px;
+        }
+        img {
+            max-width: 100%;
+            margin: 20px 0;
+            border: 1px solid #ddd;
+            padding: 10px;
+            border-radius: 4px;
+        }
+        .summary {
+            background-color: #f9f9f9;
+            padding: 15px;
+            border-left: 4px solid #007bff;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>eBPF Benchmark Analysis Report</h1>
+        <div class="summary">
+            <p>This report contains comprehensive analysis of eBPF benchmark results.</p>
+"""
+
+REPORT_HTML_FOOTER = """\
+        </div>
+
+        <h2>Throughput Comparison</h2>
+        <img src="throughput_comparison.png" alt="Throughput Comparison">
+
+        <h2>Latency Distribution</h2>
+        <img src="latency_distribution.png" alt="Latency Distribution">
+
+        <h2>Program Type Comparison</h2>
+        <img src="program_type_comparison.png" alt="Program Type Comparison">
+
+        <h2>Data Mechanism Comparison</h2>
+        <img src="data_mechanism_comparison.png" alt="Data Mechanism Comparison">
+
+        <h2>Performance Heatmap</h2>
+        <img src="performance_heatmap.png" alt="Performance Heatmap">
+
+        <h2>CPU Usage Analysis</h2>
+        <img src="cpu_usage_analysis.png" alt="CPU Usage Analysis">
+
+        <h2>Duration Comparison</h2>
+        <img src="duration_comparison.png" alt="Duration Comparison">
+    </div>
+</body>
+</html>
+"""
+
+# Generator shared by all plot jobs in a worker process
+_worker_generator = None
+
+
+def _load_plotting():
+    """Import pyplot (on the Agg backend) and seaborn on first use"""
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend for headless systems
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set style
+    sns.set_style("whitegrid")
+    sns.set_palette("husl")
+    return plt, sns
+
+
+def _init_worker(generator):
+    """Install the shared generator in a plot worker process"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _dispatch(method_name: str):
+    """Run one plot method in a worker process"""
+    getattr(_worker_generator, method_name)()
+
 
 class PlotGenerator:
     """Generate analysis plots from benchmark results"""
@@ -27,35 +145,105 @@ class PlotGenerator:
         self.processor.load_results()
         self.df = self.processor.to_dataframe()
 
-        # Set style
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
+        # matplotlib/seaborn are only imported once plots are wanted
+        self._plt, self._sns = _load_plotting()
+        self._figures = {}
+        self._scan_columns()
+        self._build_palette()
+
+    def _scan_columns(self):
+        """Record once which optional metrics have any data to plot"""
+        def has_data(col):
+            return col in self.df.columns and bool(self.df[col].notna().any())
+
+        self._has_throughput = has_data('metric_throughput')
+        self._has_cpu = has_data('metric_cpu_usage_percent')
+
+    def _build_palette(self):
+        """Fix language order and colors once for every plot"""
+        if self.df.empty:
+            self._languages = []
+        else:
+            self._languages = sorted(self.df['language'].dropna().unique())
+        self._palette = dict(zip(
+            self._languages,
+            self._sns.color_palette('husl', n_colors=len(self._languages))
+        ))
+
+    def _figure(self, figsize):
+        """Cleared reusable figure and a fresh axes for the given size"""
+        fig = self._figures.get(figsize)
+        if fig is None:
+            fig = self._figures[figsize] = self._plt.figure(figsize=figsize)
+        else:
+            fig.clear()
+        return fig, fig.add_subplot(111)
+
+    def reload(self):
+        """Reload results and drop cached plot frames"""
+        self.processor.load_results()
+        self.df = self.processor.to_dataframe()
+        self._scan_columns()
+        self._build_palette()
+        for name in ('_throughput_frame', '_latency_cols', '_latency_frame', '_heatmap_pivot'):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _throughput_frame(self) -> pd.DataFrame:
+        """Rows with a throughput metric, projected to the plotted columns"""
+        if not self._has_throughput:
+            return pd.DataFrame()
+
+        return self.df.dropna(subset=['metric_throughput'])[
+            ['benchmark_id', 'language', 'program_type', 'data_mechanism', 'metric_throughput']
+        ]
+
+    @cached_property
+    def _latency_cols(self) -> List[str]:
+        """Latency metric columns present in the results"""
+        return [col for col in self.df.columns if 'latency' in col.lower()]
+
+    @cached_property
+    def _latency_frame(self) -> pd.DataFrame:
+        """Latency metrics in long form (benchmark_id, language, metric, latency_us)"""
+        if self.df.empty or not self._latency_cols:
+            return pd.DataFrame()
+
+        # Plain-string languages: faceted catplot mismatches dict palettes
+        # against categorical hue levels
+        return self.df.melt(
+            id_vars=['benchmark_id', 'language'],
+            value_vars=self._latency_cols,
+            var_name='metric',
+            value_name='latency_us'
+        ).dropna(subset=['latency_us']).astype({'language': str})
+
+    @cached_property
+    def _heatmap_pivot(self) -> pd.DataFrame:
+        """Mean throughput per benchmark and language"""
+        return self.processor.get_throughput_matrix()
 
     def plot_throughput_comparison(self, benchmark_id: Optional[str] = None):
         """Plot throughput comparison across languages"""
-        if self.df.empty:
+        if not self._has_throughput:
             return
 
-        df = self.df.copy()
+        plot_data = self._throughput_frame
         if benchmark_id:
-            df = df[df['benchmark_id'] == benchmark_id]
-
-        if 'metric_throughput' not in df.columns:
-            return
-
-        fig, ax = plt.subplots(figsize=(10, 6))
+            plot_data = plot_data[plot_data['benchmark_id'] == benchmark_id]
+            if plot_data.empty:
+                return
 
-        # Prepare data
-        plot_data = df.dropna(subset=['metric_throughput'])
-        if plot_data.empty:
-            return
+        fig, ax = self._figure((10, 6))
 
         # Create bar plot
-        sns.barplot(
+        self._sns.barplot(
             data=plot_data,
             x='benchmark_id',
             y='metric_throughput',
             hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
             ax=ax
         )
 
@@ -65,150 +253,134 @@ class PlotGenerator:
         ax.legend(title="Language")
 
         # Format y-axis
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
 
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        self._plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
 
         output_file = self.output_dir / "throughput_comparison.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved throughput plot to {output_file}")
 
     def plot_latency_distribution(self, benchmark_id: Optional[str] = None):
         """Plot latency distribution across languages"""
-        if self.df.empty:
+        if not self._latency_cols:
             return
 
-        df = self.df.copy()
+        df = self._latency_frame
         if benchmark_id:
             df = df[df['benchmark_id'] == benchmark_id]
 
-        # Check for latency columns
-        latency_cols = [col for col in df.columns if 'latency' in col.lower()]
-        if not latency_cols:
+        if df.empty:
             return
 
-        fig, axes = plt.subplots(1, len(latency_cols), figsize=(5 * len(latency_cols), 4))
-        if len(latency_cols) == 1:
-            axes = [axes]
-
-        for ax, latency_col in zip(axes, latency_cols):
-            plot_data = df.dropna(subset=[latency_col])
-            if plot_data.empty:
-                continue
-
-            sns.boxplot(data=plot_data, x='language', y=latency_col, ax=ax)
-            ax.set_title(f"{latency_col}")
-            ax.set_ylabel("Latency (µs)")
-            ax.set_xlabel("Language")
+        # One faceted boxplot, one panel per latency metric
+        grid = self._sns.catplot(
+            data=df,
+            x='language',
+            y='latency_us',
+            order=self._languages,
+            hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
+            legend=False,
+            dodge=False,
+            col='metric',
+            col_order=[col for col in self._latency_cols if col in set(df['metric'])],
+            kind='box',
+            sharey=False,
+            height=4,
+            aspect=1.25
+        )
+        grid.set_titles("{col_name}")
+        grid.set_axis_labels("Language", "Latency (µs)")
 
-        plt.tight_layout()
+        fig = grid.figure
+        fig.tight_layout()
 
         output_file = self.output_dir / "latency_distribution.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
+        self._plt.close(fig)
 
         print(f"✓ Saved latency plot to {output_file}")
 
     def plot_program_type_comparison(self):
         """Compare performance across different program types"""
-        if self.df.empty or 'metric_throughput' not in self.df.columns:
+        if not self._has_throughput:
             return
 
-        df = self.df.copy()
-        plot_data = df.dropna(subset=['metric_throughput'])
-
-        if plot_data.empty:
-            return
+        plot_data = self._throughput_frame
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._figure((12, 6))
 
-        sns.barplot(
+        self._sns.barplot(
             data=plot_data,
             x='program_type',
             y='metric_throughput',
             hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
             ax=ax
         )
 
         ax.set_title("Performance Comparison by eBPF Program Type")
         ax.set_ylabel("Throughput (events/sec)")
         ax.set_xlabel("Program Type")
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
 
-        plt.xticks(rotation=45, ha='right')
-        plt.legend(title="Language")
-        plt.tight_layout()
+        self._plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.legend(title="Language")
+        fig.tight_layout()
 
         output_file = self.output_dir / "program_type_comparison.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved program type plot to {output_file}")
 
     def plot_data_mechanism_comparison(self):
         """Compare performance across data mechanisms"""
-        if self.df.empty or 'metric_throughput' not in self.df.columns:
+        if not self._has_throughput:
             return
 
-        df = self.df.copy()
-        plot_data = df.dropna(subset=['metric_throughput'])
-
-        if plot_data.empty:
-            return
+        plot_data = self._throughput_frame
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._figure((12, 6))
 
-        sns.barplot(
+        self._sns.barplot(
             data=plot_data,
             x='data_mechanism',
             y='metric_throughput',
             hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
             ax=ax
         )
 
         ax.set_title("Performance Comparison by Data Mechanism")
         ax.set_ylabel("Throughput (events/sec)")
         ax.set_xlabel("Data Mechanism")
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
+        ax.yaxis.set_major_formatter(self._plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}K'))
 
-        plt.xticks(rotation=45, ha='right')
-        plt.legend(title="Language")
-        plt.tight_layout()
+        self._plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.legend(title="Language")
+        fig.tight_layout()
 
         output_file = self.output_dir / "data_mechanism_comparison.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved data mechanism plot to {output_file}")
 
     def plot_language_performance_heatmap(self):
         """Create heatmap of language performance across benchmarks"""
-        if self.df.empty or 'metric_throughput' not in self.df.columns:
-            return
-
-        df = self.df.copy()
-        plot_data = df.dropna(subset=['metric_throughput'])
-
-        if plot_data.empty:
+        if not self._has_throughput:
             return
 
-        # Create pivot table
-        pivot = plot_data.pivot_table(
-            values='metric_throughput',
-            index='benchmark_id',
-            columns='language',
-            aggfunc='mean'
-        )
-
-        if pivot.empty:
-            return
+        pivot = self._heatmap_pivot
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._figure((10, 8))
 
-        sns.heatmap(
+        self._sns.heatmap(
             pivot,
             annot=True,
             fmt='.0f',
@@ -221,31 +393,32 @@ class PlotGenerator:
         ax.set_ylabel("Benchmark")
         ax.set_xlabel("Language")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         output_file = self.output_dir / "performance_heatmap.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved heatmap to {output_file}")
 
     def plot_cpu_usage_analysis(self):
         """Plot CPU usage comparison"""
-        if self.df.empty or 'metric_cpu_usage_percent' not in self.df.columns:
+        if not self._has_cpu:
             return
 
-        df = self.df.copy()
-        plot_data = df.dropna(subset=['metric_cpu_usage_percent'])
+        plot_data = self.df.dropna(subset=['metric_cpu_usage_percent'])
 
-        if plot_data.empty:
-            return
-
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._figure((10, 6))
 
-        sns.boxplot(
+        self._sns.boxplot(
             data=plot_data,
             x='language',
             y='metric_cpu_usage_percent',
+            order=self._languages,
+            hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
+            legend=False,
+            dodge=False,
             ax=ax
         )
 
@@ -253,11 +426,10 @@ class PlotGenerator:
         ax.set_ylabel("CPU Usage (%)")
         ax.set_xlabel("Language")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         output_file = self.output_dir / "cpu_usage_analysis.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved CPU usage plot to {output_file}")
 
@@ -266,125 +438,76 @@ class PlotGenerator:
         if self.df.empty:
             return
 
-        df = self.df.copy()
-
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._figure((10, 6))
 
-        sns.barplot(
-            data=df,
+        self._sns.barplot(
+            data=self.df,
             x='benchmark_id',
             y='duration',
             hue='language',
+            hue_order=self._languages,
+            palette=self._palette,
             ax=ax
         )
 
         ax.set_title("Benchmark Duration Comparison")
         ax.set_ylabel("Duration (seconds)")
         ax.set_xlabel("Benchmark")
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        self._plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
 
         output_file = self.output_dir / "duration_comparison.png"
-        plt.savefig(output_file, dpi=150)
-        plt.close()
+        fig.savefig(output_file, dpi=150, metadata={})
 
         print(f"✓ Saved duration plot to {output_file}")
 
-    def generate_all(self):
-        """Generate all available plots"""
+    def __getstate__(self):
+        # The processor holds per-instance caches that cannot be pickled;
+        # worker processes only need the prepared frames.
+        state = self.__dict__.copy()
+        state.pop('processor', None)
+        state.pop('_plt', None)
+        state.pop('_sns', None)
+        state.pop('_figures', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._plt, self._sns = _load_plotting()
+        self._figures = {}
+
+    def generate_all(self, jobs: Optional[int] = None):
+        """Generate all available plots, rendering in parallel across processes"""
         print("Generating plots...")
 
-        self.plot_throughput_comparison()
-        self.plot_latency_distribution()
-        self.plot_program_type_comparison()
-        self.plot_data_mechanism_comparison()
-        self.plot_language_performance_heatmap()
-        self.plot_cpu_usage_analysis()
-        self.plot_duration_comparison()
+        if jobs is None:
+            jobs = min(len(PLOT_METHODS), os.cpu_count() or 1)
+
+        if jobs <= 1:
+            for method_name in PLOT_METHODS:
+                getattr(self, method_name)()
+        else:
+            # Build the shared frames once so every worker receives them ready
+            self._throughput_frame
+            self._latency_frame
+            self._heatmap_pivot
+
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self,)
+            ) as executor:
+                list(executor.map(_dispatch, PLOT_METHODS))
 
         print(f"\n✓ All plots saved to {self.output_dir}")
 
     def generate_report_html(self):
         """Generate HTML report with all plots"""
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>eBPF Benchmark Report</title>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    margin: 20px;
-                    background-color: #f5f5f5;
-                }
-                .container {
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 20px;
-                    border-radius: 5px;
-                    box-shadow: 0 0 10px rgba(0,0,0,0.1);
-                }
-                h1 {
-                    color: #333;
-                    border-bottom: 3px solid #007bff;
-                    padding-bottom: 10px;
-                }
-                h2 {
-                    color: #555;
-                    margin-top: 30px;
-                }
-                img {
-                    max-width: 100%;
-                    margin: 20px 0;
-                    border: 1px solid #ddd;
-                    padding: 10px;
-                    border-radius: 4px;
-                }
-                .summary {
-                    background-color: #f9f9f9;
-                    padding: 15px;
-                    border-left: 4px solid #007bff;
-                    margin: 20px 0;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>eBPF Benchmark Analysis Report</h1>
-                <div class="summary">
-                    <p>This report contains comprehensive analysis of eBPF benchmark results.</p>
-                    <p>Generated: {timestamp}</p>
-                </div>
-
-                <h2>Throughput Comparison</h2>
-                <img src="throughput_comparison.png" alt="Throughput Comparison">
-
-                <h2>Latency Distribution</h2>
-                <img src="latency_distribution.png" alt="Latency Distribution">
-
-                <h2>Program Type Comparison</h2>
-                <img src="program_type_comparison.png" alt="Program Type Comparison">
-
-                <h2>Data Mechanism Comparison</h2>
-                <img src="data_mechanism_comparison.png" alt="Data Mechanism Comparison">
-
-                <h2>Performance Heatmap</h2>
-                <img src="performance_heatmap.png" alt="Performance Heatmap">
-
-                <h2>CPU Usage Analysis</h2>
-                <img src="cpu_usage_analysis.png" alt="CPU Usage Analysis">
-
-                <h2>Duration Comparison</h2>
-                <img src="duration_comparison.png" alt="Duration Comparison">
-            </div>
-        </body>
-        </html>
-        """.format(timestamp=pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"))
+        generated = f"            <p>Generated: {pd.Timestamp.now():%Y-%m-%d %H:%M:%S}</p>\n"
+        html_content = REPORT_HTML_HEADER + generated + REPORT_HTML_FOOTER
 
         html_file = self.output_dir / "report.html"
-        with open(html_file, 'w') as f:
-            f.write(html_content)
+        html_file.write_text(html_content, encoding='utf-8')
 
         print(f"✓ HTML report saved to {html_file}")
 
@@ -404,11 +527,16 @@ def main():
         default='analysis/plots',
         help='Output directory for plots'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of plot worker processes (default: one per plot, up to CPU count)'
+    )
 
     args = parser.parse_args()
 
     generator = PlotGenerator(args.dir, args.output)
-    generator.generate_all()
+    generator.generate_all(jobs=args.jobs)
     generator.generate_report_html()
 
 
@@ -5,13 +5,57 @@ Process Benchmark Results
 Load, parse, and aggregate benchmark results from JSON files
 """
 
+import os
 import json
 import csv
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Optional
 import numpy as np
-from collections import defaultdict
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+# Aggregated files that should not be re-ingested
+SKIP_FILES = frozenset({'latest.json'})
+
+# Top-level result fields carried into the DataFrame
+RESULT_FIELDS = (
+    'benchmark_id',
+    'benchmark_name',
+    'language',
+    'program_type',
+    'data_mechanism',
+    'status',
+    'timestamp',
+    'duration',
+)
+
+# Low-cardinality string fields stored as pandas categoricals
+CATEGORICAL_FIELDS = (
+    'benchmark_id',
+    'language',
+    'program_type',
+    'data_mechanism',
+    'status',
+)
 
 
 class ResultsProcessor:
@@ -22,59 +66,120 @@ class ResultsProcessor:
         self.results = []
         self.dataframe = None
 
+        # Memoized per-benchmark frames and comparisons. The DataFrame id is
+        # part of the key so a rebuilt frame never hits stale entries.
+        self._benchmark_frame_cached = lru_cache(maxsize=64)(self._benchmark_frame)
+        self._compare_cached = lru_cache(maxsize=64)(self._compare_languages)
+
+    def _clear_caches(self):
+        """Drop memoized query results"""
+        self._benchmark_frame_cached.cache_clear()
+        self._compare_cached.cache_clear()
+
     def load_results(self, pattern: str = "*.json") -> List[Dict]:
         """Load result files from directory"""
         self.results = []
+        self.dataframe = None
+        self._clear_caches()
 
-        for result_file in self.results_dir.glob(pattern):
-            if result_file.name in ['latest.json']:  # Skip aggregated files
-                continue
+        with os.scandir(self.results_dir) as entries:
+            result_files = [
+                Path(entry.path) for entry in entries
+                if entry.name not in SKIP_FILES and fnmatch(entry.name, pattern)
+            ]
 
+        for result_file in result_files:
             try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-
-                # Handle both single result and aggregated results
-                results = data.get('results', [data])
-                self.results.extend(results)
+                if ijson is not None and 'aggregated' in result_file.name:
+                    # Stream entries of large aggregated files one at a time;
+                    # other layouts yield nothing and get a full parse below
+                    count = len(self.results)
+                    with open(result_file, 'rb') as f:
+                        self.results.extend(ijson.items(f, 'results.item', use_float=True))
+                    if len(self.results) > count:
+                        continue
+
+                if orjson is not None:
+                    data = orjson.loads(result_file.read_bytes())
+                else:
+                    with open(result_file, 'r') as f:
+                        data = json.load(f)
+
+                self.results.extend(self._result_rows(data))
             except Exception as e:
                 print(f"Error loading {result_file}: {e}")
 
         return self.results
 
-    def to_dataframe(self) -> pd.DataFrame:
+    @staticmethod
+    def _result_rows(data) -> List[Dict]:
+        """Result entries of a parsed file, decided from its top level
+
+        Aggregated files keep their entries under 'results', either as a list
+        or as a mapping of result objects keyed by language; anything else is
+        a single result. Mapped entries that are not harness results (no
+        benchmark_id, e.g. run_all_benchmarks archives) are skipped.
+        """
+        if isinstance(data, list):
+            return data
+
+        results = data.get('results') if isinstance(data, dict) else None
+        if isinstance(results, list):
+            return results
+        if isinstance(results, dict) and results and all(isinstance(v, dict) for v in results.values()):
+            return [
+                {**result, 'language': result.get('language', language)}
+                for language, result in results.items()
+                if 'benchmark_id' in result
+            ]
+        return [data]
+
+    def to_dataframe(self) -> "pd.DataFrame":
         """Convert results to pandas DataFrame"""
+        # pandas is imported lazily so non-DataFrame helpers stay cheap to use
+        import pandas as pd
+
         if not self.results:
             return pd.DataFrame()
 
-        # Flatten nested structures
-        flattened = []
+        # Build column-major: discover numeric metric keys, then fill
+        # preallocated columns by index
+        n = len(self.results)
+        numeric = (int, float)
+        metric_keys = {}
         for result in self.results:
-            flat_result = {
-                'benchmark_id': result.get('benchmark_id'),
-                'benchmark_name': result.get('benchmark_name'),
-                'language': result.get('language'),
-                'program_type': result.get('program_type'),
-                'data_mechanism': result.get('data_mechanism'),
-                'status': result.get('status'),
-                'timestamp': result.get('timestamp'),
-                'duration': result.get('duration', 0),
-            }
-
-            # Flatten metrics
-            metrics = result.get('metrics', {})
-            for key, value in metrics.items():
-                if isinstance(value, (int, float)):
-                    flat_result[f"metric_{key}"] = value
+            for key, value in result.get('metrics', {}).items():
+                if type(value) in numeric:
+                    metric_keys[key] = None
+
+        cols = {name: [None] * n for name in RESULT_FIELDS}
+        metric_cols = [(key, [None] * n) for key in metric_keys]
 
-            flattened.append(flat_result)
+        for i, result in enumerate(self.results):
+            for name in RESULT_FIELDS:
+                cols[name][i] = result.get(name)
+            cols['duration'][i] = result.get('duration', 0)
 
-        self.dataframe = pd.DataFrame(flattened)
+            metrics = result.get('metrics', {})
+            for key, column in metric_cols:
+                value = metrics.get(key)
+                if type(value) in numeric:
+                    column[i] = value
+
+        for key, column in metric_cols:
+            cols[f"metric_{key}"] = column
+
+        self.dataframe = pd.DataFrame(cols, copy=False)
+        for name in CATEGORICAL_FIELDS:
+            self.dataframe[name] = self.dataframe[name].astype('category')
+        self._clear_caches()
         return self.dataframe
 
     def get_summary_stats(self, benchmark_id: Optional[str] = None) -> Dict:
         """Get summary statistics for benchmarks"""
-        df = self.dataframe or self.to_dataframe()
+        import pandas as pd
+
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
 
         if benchmark_id:
             df = df[df['benchmark_id'] == benchmark_id]
@@ -82,25 +187,43 @@ class ResultsProcessor:
         if df.empty:
             return {}
 
-        summary = {}
+        keys = ['benchmark_id', 'language']
+        agg = df.groupby(keys, observed=True)['duration'].agg(
+            count='size',
+            avg_duration='mean',
+            min_duration='min',
+            max_duration='max',
+        )
+
+        # Most common status per group from one (benchmark, language, status) count
+        status_counts = df.groupby(keys + ['status'], observed=True).size().unstack(fill_value=0)
+        if status_counts.empty:
+            status_mode = pd.Series('unknown', index=agg.index)
+        else:
+            status_mode = status_counts.idxmax(axis=1).astype(object).reindex(agg.index).fillna('unknown')
+
+        agg = agg.assign(status=status_mode)[
+            ['count', 'status', 'avg_duration', 'min_duration', 'max_duration']
+        ]
 
-        # Group by language and benchmark
-        for (bench_id, language), group in df.groupby(['benchmark_id', 'language']):
-            key = f"{bench_id}_{language}"
-            summary[key] = {
-                'count': len(group),
-                'status': group['status'].mode()[0] if not group['status'].empty else 'unknown',
-                'avg_duration': group['duration'].mean(),
-                'min_duration': group['duration'].min(),
-                'max_duration': group['duration'].max(),
-            }
-
-        return summary
+        return {
+            f"{bench_id}_{language}": stats
+            for (bench_id, language), stats in agg.to_dict(orient='index').items()
+        }
 
     def compare_languages(self, benchmark_id: str, metric: str) -> Dict:
         """Compare metric across languages for specific benchmark"""
-        df = self.dataframe or self.to_dataframe()
-        df = df[df['benchmark_id'] == benchmark_id]
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
+        return self._compare_cached(id(df), benchmark_id, metric)
+
+    def _benchmark_frame(self, df_id: int, benchmark_id: str) -> "pd.DataFrame":
+        """Rows of the current DataFrame for one benchmark (df_id is a cache key)"""
+        df = self.dataframe
+        return df[df['benchmark_id'] == benchmark_id]
+
+    def _compare_languages(self, df_id: int, benchmark_id: str, metric: str) -> Dict:
+        """Uncached body of compare_languages (df_id is a cache key)"""
+        df = self._benchmark_frame_cached(df_id, benchmark_id)
 
         if df.empty:
             return {}
@@ -109,65 +232,97 @@ class ResultsProcessor:
         if metric_col not in df.columns:
             return {}
 
-        comparison = {}
-        for language, group in df.groupby('language'):
-            values = group[metric_col].dropna()
-            if not values.empty:
-                comparison[language] = {
-                    'mean': values.mean(),
-                    'median': values.median(),
-                    'std': values.std(),
-                    'min': values.min(),
-                    'max': values.max(),
-                    'count': len(values),
-                }
-
-        return comparison
+        agg = (
+            df.groupby('language', sort=False, observed=True)[metric_col]
+            .agg(['mean', 'median', 'std', 'min', 'max', 'count'])
+            .dropna(subset=['mean'])
+        )
+
+        return agg.to_dict(orient='index')
 
     def export_csv(self, output_file: str):
-        """Export results to CSV"""
-        df = self.dataframe or self.to_dataframe()
+        """Export results to CSV (or Parquet for a .parquet file name)"""
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
 
         if df.empty:
             print("No results to export")
             return
 
-        df.to_csv(output_file, index=False)
+        if str(output_file).endswith('.parquet'):
+            df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+        elif pa is not None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, output_file)
+        else:
+            df.to_csv(output_file, index=False)
         print(f"Exported {len(df)} results to {output_file}")
 
-    def get_benchmark_comparison(self, benchmark_id: str) -> pd.DataFrame:
+    def get_benchmark_comparison(self, benchmark_id: str) -> "pd.DataFrame":
         """Get comparison DataFrame for a specific benchmark"""
-        df = self.dataframe or self.to_dataframe()
-        return df[df['benchmark_id'] == benchmark_id].copy()
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
+        return self._benchmark_frame_cached(id(df), benchmark_id).copy()
 
-    def calculate_percentiles(self, values: List[float], percentiles: List[int] = None) -> Dict:
+    def calculate_percentiles(self, values: "List[float] | np.ndarray", percentiles: List[int] = None) -> Dict:
         """Calculate percentiles for latency data"""
         if percentiles is None:
             percentiles = [50, 95, 99, 99.9]
 
-        if not values:
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.size == 0:
             return {}
 
-        return {
-            f"p{p}": np.percentile(values, p)
-            for p in percentiles
-        }
+        # One sort for all requested percentiles
+        out = np.percentile(arr, np.asarray(percentiles, dtype=np.float64))
+        return {f"p{p}": float(v) for p, v in zip(percentiles, out)}
+
+    def get_throughput_matrix(self) -> "pd.DataFrame":
+        """Get mean throughput as a benchmark x language matrix"""
+        import pandas as pd
+
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
+
+        if df.empty or 'metric_throughput' not in df.columns:
+            return pd.DataFrame()
+
+        # Group mean via bincount over the categorical codes of both keys
+        bench_codes = df['benchmark_id'].cat.codes.to_numpy(np.int64)
+        lang_codes = df['language'].cat.codes.to_numpy(np.int64)
+        values = df['metric_throughput'].to_numpy(np.float64)
+
+        benchmarks = df['benchmark_id'].cat.categories
+        languages = df['language'].cat.categories
+        n_lang = len(languages)
+        size = len(benchmarks) * n_lang
+
+        valid = (bench_codes >= 0) & (lang_codes >= 0) & ~np.isnan(values)
+        keys = bench_codes[valid] * n_lang + lang_codes[valid]
+        sums = np.bincount(keys, weights=values[valid], minlength=size)
+        counts = np.bincount(keys, minlength=size)
+
+        means = np.full(size, np.nan)
+        np.divide(sums, counts, out=means, where=counts > 0)
+
+        matrix = pd.DataFrame(
+            means.reshape(len(benchmarks), n_lang),
+            index=pd.CategoricalIndex(benchmarks, name='benchmark_id'),
+            columns=pd.CategoricalIndex(languages, name='language')
+        )
+        return matrix.dropna(how='all').dropna(axis=1, how='all')
 
     def get_throughput_comparison(self) -> Dict:
         """Get throughput comparison across all benchmarks"""
-        df = self.dataframe or self.to_dataframe()
+        import pandas as pd
 
-        comparison = defaultdict(dict)
-        for (bench_id, language), group in df.groupby(['benchmark_id', 'language']):
-            throughput = group.get('metric_throughput', [])
-            if not throughput.empty:
-                comparison[bench_id][language] = throughput.mean()
+        pivot = self.get_throughput_matrix()
 
-        return dict(comparison)
+        return {
+            bench_id: {language: value for language, value in row.items() if pd.notna(value)}
+            for bench_id, row in pivot.iterrows()
+        }
 
     def print_summary(self):
         """Print summary statistics"""
-        df = self.dataframe or self.to_dataframe()
+        df = self.dataframe if self.dataframe is not None else self.to_dataframe()
 
         if df.empty:
             print("No results loaded")
@@ -180,15 +335,19 @@ class ResultsProcessor:
         print(f"\nTotal results: {len(df)}")
         print(f"Benchmarks: {df['benchmark_id'].nunique()}")
         print(f"Languages: {df['language'].nunique()}")
-        print(f"Success rate: {(df['status'] == 'success').sum() / len(df) * 100:.1f}%")
+        statuses = df['status'].to_numpy()
+        print(f"Success rate: {np.count_nonzero(statuses == 'success') / len(df) * 100:.1f}%")
 
         print("\nResults by Benchmark:")
-        for bench_id, group in df.groupby('benchmark_id'):
-            print(f"\n  {bench_id}:")
-            for language, lang_group in group.groupby('language'):
-                status_counts = lang_group['status'].value_counts()
-                status_str = ", ".join(f"{s}={c}" for s, c in status_counts.items())
-                print(f"    {language}: {status_str}")
+        counts = df.groupby(['benchmark_id', 'language', 'status'], observed=True).size()
+        current_bench = None
+        for (bench_id, language), sub in counts.groupby(level=[0, 1], observed=True):
+            if bench_id != current_bench:
+                print(f"\n  {bench_id}:")
+                current_bench = bench_id
+            sub = sub.sort_values(ascending=False, kind='stable')
+            status_str = ", ".join(f"{s}={c}" for (_, _, s), c in sub.items())
+            print(f"    {language}: {status_str}")
 
         print("\n" + "="*80)
 
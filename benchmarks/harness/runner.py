@@ -9,14 +9,31 @@ import os
 import json
 import yaml
 import time
-import subprocess
 import argparse
+import atexit
+import io
+import pickle
+import shutil
+import signal
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 # Set up logging
 logging.basicConfig(
@@ -26,7 +43,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Stores benchmark result data"""
     benchmark_id: str
@@ -42,31 +59,113 @@ class BenchmarkResult:
     warnings: Optional[str] = None
 
     def to_dict(self):
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (metrics is shared, not deep-copied)"""
+        return {
+            'benchmark_id': self.benchmark_id,
+            'benchmark_name': self.benchmark_name,
+            'language': self.language,
+            'program_type': self.program_type,
+            'data_mechanism': self.data_mechanism,
+            'duration': self.duration,
+            'timestamp': self.timestamp,
+            'status': self.status,
+            'metrics': self.metrics,
+            'errors': self.errors,
+            'warnings': self.warnings,
+        }
 
     def to_json(self):
         """Convert to JSON string"""
+        if orjson is not None:
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
 
 
+# Attached to results that shared the machine with other benchmarks
+PARALLEL_METRICS_WARNING = (
+    "run concurrently with other benchmarks: system-wide CPU and memory "
+    "metrics include their load and are not comparable with serial runs"
+)
+
+# Default bytes read per /proc sample
+PROC_READ_BYTES = 4096
+
+# Bytes actually needed from each sampled file: the aggregate cpu line of
+# /proc/stat and the MemTotal/MemFree/MemAvailable header of /proc/meminfo.
+# Smaller reads keep the copy out of the kernel to what is parsed.
+PROC_SAMPLE_BYTES = {
+    '/proc/stat': 512,
+    '/proc/meminfo': 256,
+}
+
+
+def _sleep_until(deadline_ns: int):
+    """Sleep until an absolute time.monotonic_ns() deadline
+
+    time.sleep() is backed by clock_nanosleep(CLOCK_MONOTONIC) on Linux, so
+    looping on the remaining time keeps the wake-up anchored to the deadline
+    even if a signal handler interrupts the sleep.
+    """
+    while True:
+        remaining = deadline_ns - time.monotonic_ns()
+        if remaining <= 0:
+            return
+        time.sleep(remaining / 1e9)
+
+
+class _ProcReader:
+    """Re-reads a /proc file through one persistent descriptor
+
+    /proc files regenerate their contents on every read from offset 0, so a
+    single pread() replaces the open/read/close sequence per sample.
+    """
+
+    def __init__(self, path: str, size: int = PROC_READ_BYTES):
+        self.path = path
+        self.size = size
+        self.fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+
+    def read(self) -> bytes:
+        """Return the current file contents (up to size bytes)"""
+        return os.pread(self.fd, self.size, 0)
+
+    def close(self):
+        """Close the underlying descriptor"""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
 class SystemMetricsCollector:
     """Collects system metrics during benchmark execution"""
 
+    # /proc readers shared by all collectors, opened on first use
+    _readers: Dict[str, _ProcReader] = {}
+
+    @classmethod
+    def _proc_reader(cls, path: str) -> _ProcReader:
+        """Get the shared persistent reader for a /proc file"""
+        reader = cls._readers.get(path)
+        if reader is None:
+            size = PROC_SAMPLE_BYTES.get(path, PROC_READ_BYTES)
+            reader = cls._readers[path] = _ProcReader(path, size)
+        return reader
+
     def __init__(self):
-        self.start_time = None
-        self.end_time = None
+        # Monotonic timestamps in nanoseconds
+        self.start_ns = None
+        self.end_ns = None
         self.cpu_stats_start = None
         self.cpu_stats_end = None
 
     def start(self):
         """Start collecting metrics"""
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
         self.cpu_stats_start = self._read_cpu_stats()
 
     def end(self):
         """End collecting metrics"""
-        self.end_time = time.time()
+        self.end_ns = time.monotonic_ns()
         self.cpu_stats_end = self._read_cpu_stats()
 
     def get_cpu_usage(self):
@@ -89,126 +188,322 @@ class SystemMetricsCollector:
 
     def get_duration(self):
         """Get benchmark duration"""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1e9
         return 0.0
 
     def get_memory_usage(self):
         """Get memory usage from /proc/meminfo"""
         try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-                mem_available = 0
-                mem_total = 0
-                for line in lines:
-                    if line.startswith('MemTotal:'):
-                        mem_total = int(line.split()[1])
-                    elif line.startswith('MemAvailable:'):
-                        mem_available = int(line.split()[1])
-                return {
-                    'total_mb': mem_total / 1024,
-                    'available_mb': mem_available / 1024,
-                    'used_mb': (mem_total - mem_available) / 1024,
-                }
+            data = self._proc_reader('/proc/meminfo').read()
+            mem_total = self._meminfo_kb(data, b'MemTotal:')
+            mem_available = self._meminfo_kb(data, b'MemAvailable:')
+            return {
+                'total_mb': mem_total / 1024,
+                'available_mb': mem_available / 1024,
+                'used_mb': (mem_total - mem_available) / 1024,
+            }
         except Exception as e:
             logger.warning(f"Could not read memory info: {e}")
             return {}
 
     @staticmethod
-    def _read_cpu_stats():
+    def _meminfo_kb(data: bytes, key: bytes) -> int:
+        """Value in kB of one /proc/meminfo field, found by prefix scan"""
+        start = data.find(key)
+        if start < 0:
+            return 0
+        start += len(key)
+        end = data.find(b'\n', start)
+        if end < 0:
+            # Field cut off by the read size
+            return 0
+        return int(data[start:end].split()[0])
+
+    @classmethod
+    def _read_cpu_stats(cls):
         """Read /proc/stat for CPU statistics"""
         try:
-            with open('/proc/stat', 'r') as f:
-                line = f.readline()
-                return [int(x) for x in line.split()[1:]]
+            data = cls._proc_reader('/proc/stat').read()
+            end = data.find(b'\n')
+            fields = (data[:end] if end >= 0 else data).split()
+            return list(map(int, fields[1:]))
         except Exception as e:
             logger.warning(f"Could not read CPU stats: {e}")
             return None
 
 
+# /dev/null descriptor shared by every spawned load generator
+_DEVNULL_FD = None
+_DEVNULL_LOCK = threading.Lock()
+
+
+def _devnull_fd() -> int:
+    """Open /dev/null once and reuse the descriptor for all spawns"""
+    global _DEVNULL_FD
+    if _DEVNULL_FD is None:
+        with _DEVNULL_LOCK:
+            if _DEVNULL_FD is None:
+                _DEVNULL_FD = os.open(os.devnull, os.O_WRONLY | os.O_CLOEXEC)
+                atexit.register(os.close, _DEVNULL_FD)
+    return _DEVNULL_FD
+
+
+# stress-ng executable, resolved once at import
+_STRESS_NG = shutil.which('stress-ng')
+
+# stress-ng stressor arguments per load type
+_LOAD_TEMPLATES = {
+    'syscall_flood': ('--syscall', '4'),
+    'cpu_bound': ('--cpu', '2'),
+    'memory': ('--vm', '2', '--vm-bytes', '128M'),
+}
+
+
 class LoadGenerator:
     """Generates system load for benchmarks"""
 
     def __init__(self, load_type: str = "syscall_flood", duration: int = 10):
         self.load_type = load_type
         self.duration = duration
-        self.process = None
+        self.pid = None
+
+        if load_type in _LOAD_TEMPLATES and _STRESS_NG is None:
+            raise RuntimeError(f"stress-ng not found in PATH (needed for {load_type} load)")
 
     def start(self):
         """Start load generation"""
-        commands = {
-            'syscall_flood': f"stress-ng --syscall 4 --timeout {self.duration}s --quiet",
-            'cpu_bound': f"stress-ng --cpu 2 --timeout {self.duration}s --quiet",
-            'memory': f"stress-ng --vm 2 --vm-bytes 128M --timeout {self.duration}s --quiet",
-        }
-
-        cmd = commands.get(self.load_type)
-        if not cmd:
+        template = _LOAD_TEMPLATES.get(self.load_type)
+        if template is None:
             logger.warning(f"Unknown load type: {self.load_type}")
             return
 
+        argv = (_STRESS_NG,) + template + ('--timeout', f'{self.duration}s', '--quiet')
+
+        # Spawn stress-ng directly (no intermediate shell) so stop() signals it
         try:
-            self.process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            devnull = _devnull_fd()
+            file_actions = [
+                (os.POSIX_SPAWN_DUP2, devnull, 1),
+                (os.POSIX_SPAWN_DUP2, devnull, 2),
+            ]
+            self.pid = os.posix_spawn(_STRESS_NG, argv, os.environ, file_actions=file_actions)
             logger.info(f"Started {self.load_type} load generator")
         except Exception as e:
             logger.error(f"Failed to start load generator: {e}")
 
-    def stop(self):
+    def stop(self, timeout: float = 5.0):
         """Stop load generation"""
-        if self.process:
+        if not self.pid:
+            return
+
+        pid, self.pid = self.pid, None
+        try:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            while os.waitpid(pid, os.WNOHANG)[0] == 0:
+                if time.monotonic() >= deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    break
+                time.sleep(0.05)
+        except ChildProcessError:
+            pass
+        except ProcessLookupError:
+            # Already exited; reap it if it is still our child
             try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-            logger.info("Stopped load generator")
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        logger.info("Stopped load generator")
+
+
+def _load_config_cached(path: str) -> Dict:
+    """Load a YAML config, reusing a pickled sidecar when it is up to date"""
+    sidecar = f"{path}.pkl"
+    try:
+        if os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            with open(sidecar, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # Write the sidecar atomically; a read-only config dir just skips caching
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.debug(f"Could not cache config {path}: {e}")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    return config
+
+
+def _write_file(path: str, payload: bytes):
+    """Write bytes to a file with raw descriptor I/O"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _worker_init():
+    """Leave Ctrl-C handling to the parent runner"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
 
 class BenchmarkRunner:
     """Main benchmark execution engine"""
 
-    def __init__(self, config_path: str, output_dir: str = "results"):
+    def __init__(self, config_path: str, output_dir: str = "results", jobs: int = 1):
         self.config_path = config_path
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir_str = str(self.output_dir)
+        self._latest_path = os.path.join(self._output_dir_str, "latest.json")
+
+        # Each finished result is appended to a JSON Lines file right away so
+        # a crash mid-sweep keeps everything completed so far
+        self._run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._jsonl_path = os.path.join(self._output_dir_str, f"results_{self._run_stamp}.jsonl")
+        self._jsonl = None
 
         # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_config_cached(config_path)
 
         self.benchmarks = self.config.get('benchmarks', [])
         self.results: List[BenchmarkResult] = []
 
+        # Worker pool kept for the lifetime of the runner
+        self.jobs = max(1, jobs)
+        self.pool = None
+        if self.jobs > 1:
+            self.pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=_worker_init)
+
+    def close(self):
+        """Shut down the worker pool and close the results stream"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def _record(self, result: BenchmarkResult):
+        """Keep a finished result and append it to the JSON Lines stream"""
+        self.results.append(result)
+
+        if self._jsonl is None:
+            self._jsonl = open(self._jsonl_path, 'ab', buffering=0)
+        if orjson is not None:
+            line = orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(result.to_dict()) + "\n").encode()
+        self._jsonl.write(line)
+
     def run_all(self, language_filter: Optional[str] = None, benchmark_filter: Optional[str] = None):
         """Run all configured benchmarks"""
         logger.info(f"Starting benchmark run with {len(self.benchmarks)} benchmarks")
 
-        for benchmark in self.benchmarks:
-            if benchmark_filter and benchmark['id'] != benchmark_filter:
-                continue
-
-            languages = benchmark.get('languages', [])
-            if language_filter and language_filter not in languages:
-                continue
-
-            for language in languages:
+        benchmarks = self.benchmarks
+        if benchmark_filter:
+            benchmarks = [b for b in benchmarks if b['id'] == benchmark_filter]
+
+        if language_filter:
+            # Single-language run: one pair per benchmark that supports it
+            pairs = [
+                (benchmark, language_filter) for benchmark in benchmarks
+                if language_filter in benchmark.get('languages', ())
+            ]
+        else:
+            pairs = [
+                (benchmark, language) for benchmark in benchmarks
+                for language in benchmark.get('languages', ())
+            ]
+
+        if self.pool is None:
+            for benchmark, language in pairs:
                 self.run_single(benchmark, language)
+        else:
+            self._run_parallel(pairs)
 
         self.save_results()
         logger.info("Benchmark run complete")
 
+    def _run_parallel(self, pairs: List):
+        """Run benchmark/language pairs on the worker pool
+
+        Pairs sharing a load type never overlap, since their load generators
+        would disturb each other. Benchmarks marked ``exclusive`` run alone
+        once the pool has drained. CPU and memory are sampled system-wide, so
+        the other results are flagged with PARALLEL_METRICS_WARNING.
+        """
+        shared = [(i, p) for i, p in enumerate(pairs) if not p[0].get('exclusive')]
+        exclusive = [(i, p) for i, p in enumerate(pairs) if p[0].get('exclusive')]
+        slots: List[Optional[BenchmarkResult]] = [None] * len(pairs)
+
+        running = {}
+        busy_loads = set()
+        while shared or running:
+            # Submit every pending pair whose load type is free
+            for entry in list(shared):
+                if len(running) >= self.jobs:
+                    break
+                index, (benchmark, language) = entry
+                load_type = benchmark.get('load_type', 'syscall_flood')
+                if load_type and load_type in busy_loads:
+                    continue
+                shared.remove(entry)
+                logger.info(f"Running {benchmark['id']} ({language})")
+                future = self.pool.submit(self._run_benchmark, benchmark, language)
+                running[future] = (index, load_type)
+                if load_type:
+                    busy_loads.add(load_type)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, load_type = running.pop(future)
+                busy_loads.discard(load_type)
+                result = future.result()
+                result.warnings = PARALLEL_METRICS_WARNING
+                slots[index] = result
+                self._record(result)
+                logger.info(f"  {result.benchmark_id} ({result.language}) status: {result.status}")
+
+        for index, (benchmark, language) in exclusive:
+            logger.info(f"Running {benchmark['id']} ({language}) exclusively")
+            result = slots[index] = self._run_benchmark(benchmark, language)
+            self._record(result)
+            logger.info(f"  Status: {result.status}")
+
+        # Keep configuration order for the summary and aggregated file
+        self.results[len(self.results) - len(slots):] = slots
+
     def run_single(self, benchmark_config: Dict, language: str):
         """Run a single benchmark"""
+        logger.info(f"Running {benchmark_config['id']} ({language})")
+        result = self._run_benchmark(benchmark_config, language)
+        self._record(result)
+        logger.info(f"  Status: {result.status}")
+
+    @staticmethod
+    def _run_benchmark(benchmark_config: Dict, language: str) -> BenchmarkResult:
+        """Execute one benchmark and wrap the outcome in a BenchmarkResult"""
         benchmark_id = benchmark_config['id']
-        logger.info(f"Running {benchmark_id} ({language})")
 
         try:
-            metrics = self._execute_benchmark(benchmark_config, language)
+            metrics = BenchmarkRunner._execute_benchmark(benchmark_config, language)
 
             result = BenchmarkResult(
                 benchmark_id=benchmark_id,
@@ -237,10 +532,10 @@ class BenchmarkRunner:
                 errors=str(e)
             )
 
-        self.results.append(result)
-        logger.info(f"  Status: {result.status}")
+        return result
 
-    def _execute_benchmark(self, benchmark_config: Dict, language: str) -> Dict:
+    @staticmethod
+    def _execute_benchmark(benchmark_config: Dict, language: str) -> Dict:
         """Execute benchmark and collect metrics"""
         metrics_collector = SystemMetricsCollector()
         load_generator = None
@@ -258,7 +553,7 @@ class BenchmarkRunner:
                 load_generator.start()
 
             # Run benchmark (simplified - actual implementation would call language-specific harnesses)
-            time.sleep(duration)
+            _sleep_until(metrics_collector.start_ns + int(duration * 1_000_000_000))
 
             metrics_collector.end()
 
@@ -278,25 +573,47 @@ class BenchmarkRunner:
 
     def save_results(self):
         """Save results to JSON file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = self.output_dir / f"results_{timestamp}.json"
+        output_path = os.path.join(self._output_dir_str, f"results_{self._run_stamp}.json")
 
         results_data = {
             'timestamp': datetime.now().isoformat(),
             'config_file': str(self.config_path),
-            'results': [r.to_dict() for r in self.results],
+            # Concurrent benchmarks share the system-wide CPU/memory samples
+            'jobs': self.jobs,
+            'metrics_comparable': self.jobs == 1,
+            # orjson serializes the dataclasses natively
+            'results': self.results if orjson is not None else [r.to_dict() for r in self.results],
             'summary': self._get_summary(),
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(results_data, f, indent=2)
-
-        logger.info(f"Results saved to {output_file}")
-
-        # Also save to latest.json for easy access
-        latest_file = self.output_dir / "latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(results_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(results_data, indent=2).encode()
+        _write_file(output_path, payload)
+
+        logger.info(f"Results saved to {output_path}")
+
+        # Also save as latest.json for easy access. It is a separate file
+        # replaced atomically: other tools rewrite latest.json in place, which
+        # must not reach the timestamped archive
+        tmp_path = f"{self._latest_path}.{os.getpid()}.tmp"
+        _write_file(tmp_path, payload)
+        os.replace(tmp_path, self._latest_path)
+
+        # Flush the streamed results to disk and point latest.jsonl at them
+        if self._jsonl is not None:
+            os.fsync(self._jsonl.fileno())
+            latest_jsonl = os.path.join(self._output_dir_str, "latest.jsonl")
+            try:
+                os.unlink(latest_jsonl)
+            except FileNotFoundError:
+                pass
+            try:
+                os.symlink(os.path.basename(self._jsonl_path), latest_jsonl)
+            except OSError as e:
+                # No symlink support, or another run created it first
+                logger.warning(f"Could not link {latest_jsonl}: {e}")
 
     def _get_summary(self) -> Dict:
         """Generate summary statistics"""
@@ -312,34 +629,39 @@ class BenchmarkRunner:
 
     def print_summary(self):
         """Print summary of results"""
-        print("\n" + "="*60)
-        print("BENCHMARK SUMMARY")
-        print("="*60)
+        # Build the whole report and hand it to stdout in one write
+        buf = io.StringIO()
+        write = buf.write
+        rule = "=" * 60 + "\n"
+
+        write("\n" + rule + "BENCHMARK SUMMARY\n" + rule)
 
         for result in self.results:
             status_symbol = "✓" if result.status == 'success' else "✗"
-            print(f"\n{status_symbol} {result.benchmark_name} ({result.language})")
-            print(f"  Status: {result.status}")
-            print(f"  Duration: {result.duration:.2f}s")
+            write(f"\n{status_symbol} {result.benchmark_name} ({result.language})\n"
+                  f"  Status: {result.status}\n"
+                  f"  Duration: {result.duration:.2f}s\n")
 
             if result.metrics:
-                print(f"  Metrics:")
+                write("  Metrics:\n")
                 for key, value in result.metrics.items():
                     if isinstance(value, float):
-                        print(f"    {key}: {value:.2f}")
+                        write(f"    {key}: {value:.2f}\n")
                     else:
-                        print(f"    {key}: {value}")
+                        write(f"    {key}: {value}\n")
 
             if result.errors:
-                print(f"  Error: {result.errors}")
+                write(f"  Error: {result.errors}\n")
 
-        print("\n" + "="*60)
         summary = self._get_summary()
-        print(f"Total: {summary['total_benchmarks']} | "
+        write("\n" + rule +
+              f"Total: {summary['total_benchmarks']} | "
               f"Successful: {summary['successful']} | "
-              f"Failed: {summary['failed']}")
-        print(f"Success Rate: {summary['success_rate']*100:.1f}%")
-        print("="*60)
+              f"Failed: {summary['failed']}\n"
+              f"Success Rate: {summary['success_rate']*100:.1f}%\n" + rule)
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 def main():
@@ -365,6 +687,14 @@ def main():
         '-b', '--benchmark',
         help='Filter to specific benchmark ID'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of benchmarks to run concurrently (default: 1). CPU and '
+             'memory are sampled system-wide, so metrics of concurrent runs '
+             'include each other\'s load and are not comparable with serial runs'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -376,13 +706,17 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    runner = None
     try:
-        runner = BenchmarkRunner(args.config, args.output)
+        runner = BenchmarkRunner(args.config, args.output, jobs=args.jobs)
         runner.run_all(language_filter=args.language, benchmark_filter=args.benchmark)
         runner.print_summary()
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        if runner is not None:
+            runner.close()
 
 
 if __name__ == '__main__':
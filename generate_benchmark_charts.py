@@ -9,6 +9,12 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    import cairosvg
+except ImportError:
+    cairosvg = None
 
 # Benchmark data
 benchmarks = {
@@ -38,21 +44,48 @@ benchmarks = {
     },
 }
 
-def create_throughput_chart():
+# Per-language series shared by every chart, in benchmark order
+languages = list(benchmarks.keys())
+colors = [bench['color'] for bench in benchmarks.values()]
+throughputs = np.fromiter((bench['throughput'] for bench in benchmarks.values()),
+                          dtype=np.float64, count=len(benchmarks))
+events = np.fromiter((bench['events'] for bench in benchmarks.values()),
+                     dtype=np.float64, count=len(benchmarks))
+ratios = throughputs / throughputs[languages.index('C (libbpf)')] * 100.0
+
+# Value labels shared by the charts and the comparison matrix
+throughput_labels = [f"{value:,.0f}" for value in throughputs.tolist()]
+event_labels = [f"{value:,.0f}" for value in events.tolist()]
+use_cases = np.select(
+    [ratios >= 50, ratios >= 10, ratios >= 1],
+    ['Production', 'Good', 'Moderate'],
+    'Prototyping',
+).tolist()
+
+# Output file and panel size (inches) of each chart, in drawing order
+CHART_LAYOUT = (
+    ('throughput_comparison.png', (12, 6)),
+    ('performance_ratio.png', (12, 6)),
+    ('event_count_comparison.png', (12, 6)),
+    ('comparison_matrix.png', (14, 8)),
+    ('summary_stats.png', (14, 8)),
+)
+
+# Padding around each chart when cropped from the combined figure
+CROP_PAD_INCHES = 0.1
+
+# Static comparison matrix layout with per-language placeholders
+MATRIX_TEMPLATE = Path(__file__).parent / 'templates' / 'comparison_matrix.svg'
+
+def create_throughput_chart(fig):
     """Create throughput comparison chart"""
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    languages = list(benchmarks.keys())
-    throughputs = [benchmarks[lang]['throughput'] for lang in languages]
-    colors = [benchmarks[lang]['color'] for lang in languages]
+    ax = fig.subplots()
 
-    bars = ax.barh(languages, throughputs, color=colors, edgecolor='black', linewidth=2)
+    ax.barh(languages, throughputs, color=colors, edgecolor='black', linewidth=2)
 
     # Add value labels
-    for i, (bar, throughput) in enumerate(zip(bars, throughputs)):
-        if throughput >= 1000:
-            label = f"{throughput:,.0f}"
-        else:
+    for i, (throughput, label) in enumerate(zip(throughputs, throughput_labels)):
+        if throughput < 1000:
             label = f"{throughput:.1f}"
         ax.text(throughput, i, f'  {label} evt/sec', va='center', fontweight='bold', fontsize=11)
 
@@ -61,22 +94,16 @@ def create_throughput_chart():
     ax.set_xscale('log')
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
     return fig
 
-def create_performance_ratio_chart():
+def create_performance_ratio_chart(fig):
     """Create relative performance chart (C baseline)"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    ax = fig.subplots()
 
-    languages = list(benchmarks.keys())
-    c_throughput = benchmarks['C (libbpf)']['throughput']
-    ratios = [benchmarks[lang]['throughput'] / c_throughput * 100 for lang in languages]
-    colors = [benchmarks[lang]['color'] for lang in languages]
-
-    bars = ax.barh(languages, ratios, color=colors, edgecolor='black', linewidth=2)
+    ax.barh(languages, ratios, color=colors, edgecolor='black', linewidth=2)
 
     # Add value labels
-    for i, (bar, ratio) in enumerate(zip(bars, ratios)):
+    for i, ratio in enumerate(ratios):
         ax.text(ratio, i, f'  {ratio:.1f}%', va='center', fontweight='bold', fontsize=11)
 
     ax.axvline(x=100, color='green', linestyle='--', linewidth=2, alpha=0.7, label='C Baseline')
@@ -85,25 +112,16 @@ def create_performance_ratio_chart():
     ax.grid(axis='x', alpha=0.3, linestyle='--')
     ax.legend()
 
-    plt.tight_layout()
     return fig
 
-def create_event_count_chart():
+def create_event_count_chart(fig):
     """Create total events captured chart"""
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    languages = list(benchmarks.keys())
-    events = [benchmarks[lang]['events'] for lang in languages]
-    colors = [benchmarks[lang]['color'] for lang in languages]
+    ax = fig.subplots()
 
-    bars = ax.barh(languages, events, color=colors, edgecolor='black', linewidth=2)
+    ax.barh(languages, events, color=colors, edgecolor='black', linewidth=2)
 
     # Add value labels
-    for i, (bar, event_count) in enumerate(zip(bars, events)):
-        if event_count >= 1000:
-            label = f"{event_count:,.0f}"
-        else:
-            label = f"{event_count:.0f}"
+    for i, (event_count, label) in enumerate(zip(events, event_labels)):
         ax.text(event_count, i, f'  {label}', va='center', fontweight='bold', fontsize=11)
 
     ax.set_xlabel('Total Events Captured (10 seconds)', fontsize=12, fontweight='bold')
@@ -111,45 +129,22 @@ def create_event_count_chart():
     ax.set_xscale('log')
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
     return fig
 
-def create_comparison_matrix():
+def comparison_rows():
+    """Formatted comparison matrix cells, one row per language"""
+    return [
+        [throughput, event_count, f"{ratio:.1f}%", use_case]
+        for throughput, event_count, ratio, use_case
+        in zip(throughput_labels, event_labels, ratios.tolist(), use_cases)
+    ]
+
+def create_comparison_matrix(fig):
     """Create a detailed comparison matrix"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    ax = fig.subplots()
 
-    languages = list(benchmarks.keys())
     metrics = ['Throughput\n(evt/sec)', 'Events\nCaptured', 'Relative to C\n(%)', 'Use Case\nSuitability']
-
-    # Prepare data
-    data = []
-    for lang in languages:
-        bench = benchmarks[lang]
-        c_ratio = (bench['throughput'] / benchmarks['C (libbpf)']['throughput']) * 100
-
-        # Format throughput
-        if bench['throughput'] >= 1000:
-            throughput_str = f"{bench['throughput']:,.0f}"
-        else:
-            throughput_str = f"{bench['throughput']:.0f}"
-
-        # Format events
-        if bench['events'] >= 1000:
-            events_str = f"{bench['events']:,.0f}"
-        else:
-            events_str = f"{bench['events']:.0f}"
-
-        # Determine use case suitability
-        if c_ratio >= 50:
-            use_case = 'Production'
-        elif c_ratio >= 10:
-            use_case = 'Good'
-        elif c_ratio >= 1:
-            use_case = 'Moderate'
-        else:
-            use_case = 'Prototyping'
-
-        data.append([throughput_str, events_str, f"{c_ratio:.1f}%", use_case])
+    data = comparison_rows()
 
     # Create table
     table = ax.table(cellText=data, rowLabels=languages, colLabels=metrics,
@@ -176,37 +171,28 @@ def create_comparison_matrix():
                 table[(i+1, j)].set_facecolor('#F8F9FA')
 
     ax.axis('off')
-    plt.title('eBPF Benchmark Comparison Matrix', fontsize=14, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title('eBPF Benchmark Comparison Matrix', fontsize=14, fontweight='bold', pad=20)
     return fig
 
-def create_summary_stats():
+def create_summary_stats(fig):
     """Create summary statistics visualization"""
-    fig = plt.figure(figsize=(14, 8))
-
-    # Create grid for subplots
-    gs = fig.add_gridspec(3, 2, hspace=0.4, wspace=0.3)
-
-    languages = list(benchmarks.keys())
-    colors = [benchmarks[lang]['color'] for lang in languages]
+    # Create grid for subplots (spacing comes from the constrained layout)
+    gs = fig.add_gridspec(3, 2)
 
     # 1. Throughput comparison (log scale)
     ax1 = fig.add_subplot(gs[0, :])
-    throughputs = [benchmarks[lang]['throughput'] for lang in languages]
     bars1 = ax1.bar(languages, throughputs, color=colors, edgecolor='black', linewidth=2)
     ax1.set_ylabel('Throughput (events/sec)', fontweight='bold')
     ax1.set_title('Throughput Comparison (Log Scale)', fontweight='bold', fontsize=12)
     ax1.set_yscale('log')
     ax1.grid(axis='y', alpha=0.3)
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:,.0f}',
+    for bar, label in zip(bars1, throughput_labels):
+        ax1.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
+                label,
                 ha='center', va='bottom', fontweight='bold', fontsize=9)
 
     # 2. Event count
     ax2 = fig.add_subplot(gs[1, 0])
-    events = [benchmarks[lang]['events'] for lang in languages]
     bars2 = ax2.bar(languages, events, color=colors, edgecolor='black', linewidth=2)
     ax2.set_ylabel('Event Count', fontweight='bold')
     ax2.set_title('Events Captured (10s)', fontweight='bold', fontsize=11)
@@ -216,8 +202,6 @@ def create_summary_stats():
 
     # 3. Performance ratio
     ax3 = fig.add_subplot(gs[1, 1])
-    c_throughput = benchmarks['C (libbpf)']['throughput']
-    ratios = [benchmarks[lang]['throughput'] / c_throughput * 100 for lang in languages]
     bars3 = ax3.bar(languages, ratios, color=colors, edgecolor='black', linewidth=2)
     ax3.set_ylabel('Relative to C (%)', fontweight='bold')
     ax3.set_title('Performance Ratio vs C Baseline', fontweight='bold', fontsize=11)
@@ -250,9 +234,74 @@ def create_summary_stats():
             verticalalignment='center',
             bbox=dict(boxstyle='round', facecolor='#E8F4F8', alpha=0.8, edgecolor='#2C3E50', linewidth=2))
 
-    plt.suptitle('eBPF Ring Buffer Benchmark Summary', fontsize=14, fontweight='bold', y=0.98)
+    fig.suptitle('eBPF Ring Buffer Benchmark Summary', fontsize=14, fontweight='bold')
     return fig
 
+def create_comparison_svg():
+    """Fill the comparison matrix SVG template with the benchmark values"""
+    values = {}
+    for i, (lang, row) in enumerate(zip(languages, comparison_rows())):
+        values[f'name_{i}'] = escape(lang)
+        values[f'color_{i}'] = benchmarks[lang]['color']
+        for key, cell in zip(('throughput', 'events', 'ratio', 'use_case'), row):
+            values[f'{key}_{i}'] = escape(cell)
+
+    return MATRIX_TEMPLATE.read_text(encoding='utf-8').format_map(values)
+
+def render_charts(dpi=150, skip=()):
+    """Draw every chart into one figure and rasterize it once
+
+    Returns a mapping of output file name to the RGBA pixels of that chart,
+    cropped from the combined canvas. Charts named in skip are not drawn.
+    """
+    creators = {
+        'throughput_comparison.png': create_throughput_chart,
+        'performance_ratio.png': create_performance_ratio_chart,
+        'event_count_comparison.png': create_event_count_chart,
+        'comparison_matrix.png': create_comparison_matrix,
+        'summary_stats.png': create_summary_stats,
+    }
+    layout = [(name, size) for name, size in CHART_LAYOUT if name not in skip]
+    if not layout:
+        return {}
+
+    widths = [size[0] for _, size in layout]
+    heights = [size[1] for _, size in layout]
+    fig_width = max(widths)
+    # constrained_layout=True keeps this working on matplotlib 3.4
+    fig = plt.figure(figsize=(fig_width, sum(heights)), dpi=dpi, constrained_layout=True)
+    fig.set_constrained_layout_pads(h_pad=CROP_PAD_INCHES, w_pad=CROP_PAD_INCHES)
+    rows = fig.subfigures(len(layout), 1, height_ratios=heights, squeeze=False)[:, 0]
+
+    # Narrower charts get a column of their own width so they are laid out
+    # (and cropped) at their own size rather than the figure's
+    subfigs = []
+    for (filename, (width, _)), row in zip(layout, rows):
+        if width < fig_width:
+            row = row.subfigures(1, 2, width_ratios=[width, fig_width - width])[0]
+        creators[filename](row)
+        subfigs.append(row)
+
+    # Single Agg pass for all charts
+    fig.canvas.draw()
+    renderer = fig.canvas.get_renderer()
+    pixels = np.asarray(fig.canvas.buffer_rgba())
+    canvas_height, canvas_width = pixels.shape[:2]
+    pad = CROP_PAD_INCHES * dpi
+
+    images = {}
+    for (filename, _), subfig in zip(layout, subfigs):
+        # Display coordinates have their origin at the bottom left
+        bbox = subfig.get_tightbbox(renderer)
+        x0 = max(int(bbox.x0 - pad), 0)
+        x1 = min(int(np.ceil(bbox.x1 + pad)), canvas_width)
+        y0 = max(int(canvas_height - bbox.y1 - pad), 0)
+        y1 = min(int(np.ceil(canvas_height - bbox.y0 + pad)), canvas_height)
+        images[filename] = pixels[y0:y1, x0:x1].copy()
+
+    plt.close(fig)
+    return images
+
 def main():
     """Generate all charts and save to files"""
     output_dir = Path(__file__).parent / 'benchmark_charts'
@@ -260,21 +309,27 @@ def main():
 
     print("Generating benchmark visualization charts...")
 
-    # Generate charts
-    charts = {
-        'throughput_comparison.png': create_throughput_chart(),
-        'performance_ratio.png': create_performance_ratio_chart(),
-        'event_count_comparison.png': create_event_count_chart(),
-        'comparison_matrix.png': create_comparison_matrix(),
-        'summary_stats.png': create_summary_stats(),
-    }
-
-    # Save charts
-    for filename, fig in charts.items():
+    # The comparison matrix comes from a static SVG template; it is only
+    # rasterized here when cairosvg is available, otherwise matplotlib
+    # draws the PNG as before
+    svg = create_comparison_svg()
+    svg_path = output_dir / 'comparison_matrix.svg'
+    svg_path.write_text(svg, encoding='utf-8')
+    print(f"✓ Saved: {svg_path}")
+
+    skip = ()
+    if cairosvg is not None:
+        png_path = output_dir / 'comparison_matrix.png'
+        cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=str(png_path), output_width=2100)
+        print(f"✓ Saved: {png_path}")
+        skip = ('comparison_matrix.png',)
+
+    # Generate and save charts
+    dpi = 150
+    for filename, image in render_charts(dpi, skip).items():
         filepath = output_dir / filename
-        fig.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.imsave(filepath, image, dpi=dpi)
         print(f"✓ Saved: {filepath}")
-        plt.close(fig)
 
     print("\nAll charts generated successfully!")
     print(f"Output directory: {output_dir}")
@@ -5,12 +5,31 @@ Generate comprehensive benchmark comparison report
 Analyzes benchmark results and creates comparative analysis and visualizations
 """
 
+import os
 import json
+import argparse
+from dataclasses import dataclass
+from functools import cached_property, partial
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 # Try to import plotting libraries, with graceful fallback
 try:
     import matplotlib.pyplot as plt
@@ -28,37 +47,318 @@ except ImportError:
     NUMPY_AVAILABLE = False
 
 
+# Bound formatters for plot labels
+_FMT_INT = "{:,.0f}".format
+_FMT_PCT = "{:.1f}%".format
+
+# Resolution of the comparison PNG; 100 dpi is enough for a 12x10in figure
+PLOT_DPI = 100
+
+# Relative-performance bars for the text report, one block per 5%
+BARS = tuple("█" * i for i in range(21))
+
+# Aggregated files written by run_all_benchmarks.py, not per-language results
+SKIP_FILES = frozenset({'latest.json'})
+SKIP_PREFIX = 'benchmark_results_'
+
+# Report field -> snake_case key used by some languages in the run_all
+# archive (benchmark_results_*.json / latest.json) and by python_result.json
+ARCHIVE_KEYS = {
+    'Throughput': 'throughput',
+    'Duration': 'duration',
+    'EventCount': 'event_count',
+    'ProgramType': 'program_type',
+    'DataMechanism': 'data_mechanism',
+    'Language': 'language',
+}
+
+# Parser reused across archives; it owns a growable document buffer
+_ARCHIVE_PARSER = simdjson.Parser() if simdjson is not None else None
+
+# JSON object types as returned by the archive parser
+_JSON_OBJECTS = (dict, simdjson.Object) if simdjson is not None else (dict,)
+
+# Per-language result fields used by the report. With msgspec only these are
+# materialized from each file; other keys are skipped during decoding.
+if msgspec is not None:
+    class BenchmarkResult(msgspec.Struct):
+        """Fields of a per-language result file used by the report"""
+        Throughput: float = 0
+        Duration: float = 0
+        EventCount: int = 0
+        ProgramType: str = "Unknown"
+        DataMechanism: str = "Unknown"
+        Language: str = ""
+
+    # Both spellings of every field, so snake_case files decode in one pass
+    _ResultKeys = msgspec.defstruct('_ResultKeys', [
+        (key, Optional[BenchmarkResult.__annotations__[name]], None)
+        for name, alias in ARCHIVE_KEYS.items() for key in (name, alias)
+    ])
+    DECODER = msgspec.json.Decoder(_ResultKeys)
+else:
+    @dataclass(slots=True)
+    class BenchmarkResult:
+        """Fields of a per-language result file used by the report"""
+        Throughput: float = 0
+        Duration: float = 0
+        EventCount: int = 0
+        ProgramType: str = "Unknown"
+        DataMechanism: str = "Unknown"
+        Language: str = ""
+
+    DECODER = None
+
+
+def decode_result(raw: bytes) -> BenchmarkResult:
+    """Decode a per-language result file into a BenchmarkResult"""
+    if DECODER is not None:
+        return _result_from(partial(getattr, DECODER.decode(raw)))
+
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return _result_from(data.get)
+
+
+def _result_from(get) -> BenchmarkResult:
+    """Build a BenchmarkResult from a key lookup, falling back to snake_case keys"""
+    values = {}
+    for name, alias in ARCHIVE_KEYS.items():
+        value = get(name)
+        if value is None:
+            value = get(alias)
+        if value is not None:
+            values[name] = value
+    return BenchmarkResult(**values)
+
+
+# Static head of the HTML report, up to the summary block
+HTML_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>eBPF Benchmark Report</title>
+            <style>
+                body {
+                    font-family: Arial, sans-serif;
+                    margin: 20px;
+                    background-color: #f5f5f5;
+                }
+                .container {
+                    max-width: 1000px;
+                    margin: 0 auto;
+                    background-color: white;
+                    padding: 30px;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                }
+                h1 {
+                    color: #333;
+                    border-bottom: 3px solid #007bff;
+                    padding-bottom: 10px;
+                }
+                table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                }
+                th {
+                    background-color: #007bff;
+                    color: white;
+                    padding: 12px;
+                    text-align: left;
+                    border: 1px solid #ddd;
+                }
+                td {
+                    padding: 10px;
+                    border: 1px solid #ddd;
+                }
+                tr:nth-child(even) {
+                    background-color: #f9f9f9;
+                }
+                .metric {
+                    background-color: #f0f0f0;
+                    padding: 15px;
+                    margin: 10px 0;
+                    border-left: 4px solid #007bff;
+                }
+                .summary {
+                    background-color: #e7f3ff;
+                    padding: 15px;
+                    border-radius: 4px;
+                    margin: 20px 0;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>eBPF Benchmark Comparison Report</h1>
+
+                <div class="summary">
+"""
+
+# Static results table header, between the summary block and the rows
+HTML_TABLE_HEAD = """                </div>
+
+                <h2>Results Table</h2>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Language</th>
+                            <th>Throughput (events/sec)</th>
+                            <th>Relative Performance</th>
+                            <th>Duration (sec)</th>
+                            <th>Total Events</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        """
+
+
+def load_archive(path) -> Dict[str, BenchmarkResult]:
+    """Load the per-language results of a run_all archive, skipping failed runs.
+
+    With simdjson only the report fields of each language are materialized;
+    the rest of the document is never converted to Python objects.
+    """
+    raw = Path(path).read_bytes()
+    if _ARCHIVE_PARSER is not None:
+        doc = _ARCHIVE_PARSER.parse(raw)
+    else:
+        doc = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # The harness's own latest.json keeps a list of runs under 'results';
+    # only run_all archives map language -> result
+    languages = doc.get('results') if isinstance(doc, _JSON_OBJECTS) else None
+    if not isinstance(languages, _JSON_OBJECTS):
+        print(f"Skipping {path}: not a run_all archive (no per-language results)")
+        return {}
+
+    results = {}
+    for language, blob in languages.items():
+        if not isinstance(blob, _JSON_OBJECTS) or blob.get('status') == 'failed':
+            continue
+
+        results[language] = _result_from(blob.get)
+    return results
+
+
 class BenchmarkReport:
     """Generate benchmarking report from results"""
 
-    def __init__(self, results_dir: str = "benchmarks/results"):
+    # Decoded result files shared across instances: path -> (st_mtime_ns, result)
+    _cache: Dict[str, tuple] = {}
+
+    def __init__(self, results_dir: str = "benchmarks/results", archive: Optional[str] = None):
         self.results_dir = Path(results_dir)
+        self.archive = archive
         self.results = {}
+        # One timestamp shared by the text and HTML reports
+        self._generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self.load_results()
 
+    def _clear_cached(self):
+        """Drop values derived from a previous load"""
+        for name in ('sorted_results', 'languages', 'throughputs', 'events', 'best_throughput', 'inv_best', 'summary'):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def sorted_results(self) -> List[tuple]:
+        """(language, result) pairs sorted by throughput, fastest first"""
+        return sorted(
+            self.results.items(),
+            key=lambda x: x[1].Throughput,
+            reverse=True
+        )
+
+    @cached_property
+    def languages(self) -> List[str]:
+        """Languages in throughput order"""
+        return [lang for lang, _ in self.sorted_results]
+
+    @cached_property
+    def throughputs(self) -> List[float]:
+        """Throughputs in throughput order"""
+        return [data.Throughput for _, data in self.sorted_results]
+
+    @cached_property
+    def events(self) -> List[int]:
+        """Event counts in throughput order"""
+        return [data.EventCount for _, data in self.sorted_results]
+
+    @cached_property
+    def best_throughput(self) -> float:
+        """Throughput of the fastest language (1 when there are no results)"""
+        return self.throughputs[0] if self.throughputs else 1
+
+    @cached_property
+    def inv_best(self) -> float:
+        """Scale from throughput to percent of the fastest (0 without a positive best)"""
+        best_throughput = self.best_throughput
+        return (100.0 / best_throughput) if best_throughput > 0 else 0
+
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Best/worst language and throughput mean/median, read off the sorted series"""
+        languages = self.languages
+        throughputs = self.throughputs
+        n = len(throughputs)
+        if not n:
+            return {}
+
+        mid = n // 2
+        median = throughputs[mid] if n % 2 else (throughputs[mid - 1] + throughputs[mid]) / 2
+        return {
+            'best': languages[0],
+            'best_throughput': throughputs[0],
+            'worst': languages[-1],
+            'worst_throughput': throughputs[-1],
+            'mean': sum(throughputs) / n,
+            'median': median,
+        }
+
     def load_results(self):
-        """Load all JSON result files"""
+        """Load all JSON result files (or the languages of a run_all archive)"""
+        self._clear_cached()
+        if self.archive is not None:
+            self.results.update(load_archive(self.archive))
+            return
+
         if not self.results_dir.exists():
             print(f"Results directory {self.results_dir} not found")
             return
 
-        for result_file in self.results_dir.glob("*.json"):
-            if result_file.name in ["latest.json", "benchmark_results_*.json"]:
-                continue
+        with os.scandir(self.results_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.json') or name in SKIP_FILES or name.startswith(SKIP_PREFIX):
+                    continue
+
+                try:
+                    data = self._load_cached(entry)
 
-            try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
                     # Extract language from filename or data
-                    if "Language" in data:
-                        language = data["Language"]
+                    if data.Language:
+                        language = data.Language
                     else:
-                        language = result_file.stem.split("_")[0].upper()
+                        language = name[:-len('.json')].split("_")[0].upper()
 
                     self.results[language] = data
-                    print(f"✓ Loaded {language} results from {result_file.name}")
-            except Exception as e:
-                print(f"⚠ Error loading {result_file.name}: {e}")
+                    print(f"✓ Loaded {language} results from {name}")
+                except Exception as e:
+                    print(f"⚠ Error loading {name}: {e}")
+
+    @classmethod
+    def _load_cached(cls, entry: os.DirEntry) -> BenchmarkResult:
+        """Decode a result file, reusing the cached result while its mtime is unchanged"""
+        mtime_ns = entry.stat().st_mtime_ns
+        cached = cls._cache.get(entry.path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(entry.path, 'rb') as f:
+            data = decode_result(f.read())
+        cls._cache[entry.path] = (mtime_ns, data)
+        return data
 
     def generate_text_report(self) -> str:
         """Generate text-based comparison report"""
@@ -69,7 +369,7 @@ class BenchmarkReport:
         report.append("\n" + "="*80)
         report.append("eBPF BENCHMARK COMPARISON REPORT")
         report.append("="*80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Generated: {self._generated_at}")
         report.append(f"Number of languages tested: {len(self.results)}")
         report.append("="*80)
 
@@ -77,26 +377,21 @@ class BenchmarkReport:
         if self.results:
             first_result = next(iter(self.results.values()))
             report.append(f"\nBenchmark Configuration:")
-            report.append(f"  Program Type:     {first_result.get('ProgramType', 'Unknown')}")
-            report.append(f"  Data Mechanism:   {first_result.get('DataMechanism', 'Unknown')}")
-            report.append(f"  Duration:         {first_result.get('Duration', 0):.2f} seconds")
+            report.append(f"  Program Type:     {first_result.ProgramType}")
+            report.append(f"  Data Mechanism:   {first_result.DataMechanism}")
+            report.append(f"  Duration:         {first_result.Duration:.2f} seconds")
 
         # Results table
         report.append("\n" + "-"*80)
         report.append(f"{'Language':<12} {'Throughput':<20} {'Duration':<15} {'Events':<15}")
         report.append("-"*80)
 
-        # Sort by throughput (descending)
-        sorted_results = sorted(
-            self.results.items(),
-            key=lambda x: x[1].get('Throughput', 0),
-            reverse=True
-        )
+        sorted_results = self.sorted_results
 
         for language, data in sorted_results:
-            throughput = data.get('Throughput', 0)
-            duration = data.get('Duration', 0)
-            event_count = data.get('EventCount', 0)
+            throughput = data.Throughput
+            duration = data.Duration
+            event_count = data.EventCount
 
             report.append(f"{language:<12} {throughput:>18,.0f} ev/s {duration:>13.2f}s {event_count:>13,}")
 
@@ -104,29 +399,24 @@ class BenchmarkReport:
 
         # Performance comparison
         if len(sorted_results) > 1:
-            best_throughput = sorted_results[0][1].get('Throughput', 1)
+            inv_best = self.inv_best
             report.append("\nRelative Performance (normalized to fastest):")
             report.append("-"*80)
 
             for language, data in sorted_results:
-                throughput = data.get('Throughput', 0)
-                relative = (throughput / best_throughput * 100) if best_throughput > 0 else 0
-                bar_width = int(relative / 5)
-                bar = "█" * bar_width
-
-                report.append(f"{language:<12} {relative:>6.1f}% {bar}")
+                relative = data.Throughput * inv_best
+                report.append(f"{language:<12} {relative:>6.1f}% {BARS[min(int(relative) // 5, 20)]}")
 
         report.append("\n" + "="*80)
 
         # Summary
         report.append("\nKey Observations:")
-        if sorted_results:
-            best, best_data = sorted_results[0]
-            report.append(f"  • Best performance: {best} ({best_data.get('Throughput', 0):,.0f} events/sec)")
+        summary = self.summary
+        if summary:
+            report.append(f"  • Best performance: {summary['best']} ({summary['best_throughput']:,.0f} events/sec)")
 
         if len(sorted_results) > 1:
-            worst, worst_data = sorted_results[-1]
-            report.append(f"  • Lowest performance: {worst} ({worst_data.get('Throughput', 0):,.0f} events/sec)")
+            report.append(f"  • Lowest performance: {summary['worst']} ({summary['worst_throughput']:,.0f} events/sec)")
 
         report.append("\n" + "="*80 + "\n")
 
@@ -137,156 +427,78 @@ class BenchmarkReport:
         if not self.results:
             return "<html><body><p>No results available</p></body></html>"
 
-        # Sort results by throughput
-        sorted_results = sorted(
-            self.results.items(),
-            key=lambda x: x[1].get('Throughput', 0),
-            reverse=True
-        )
+        sorted_results = self.sorted_results
+
+        inv_best = self.inv_best
+        summary = self.summary
+        best_data = sorted_results[0][1]
 
-        # Create comparison table rows
-        table_rows = []
-        best_throughput = sorted_results[0][1].get('Throughput', 1) if sorted_results else 1
+        parts = [HTML_HEAD]
+        parts.append(f"                    <p><strong>Generated:</strong> {self._generated_at}</p>\n")
+        parts.append(f"                    <p><strong>Languages Tested:</strong> {', '.join(self.languages)}</p>\n")
+        parts.append(HTML_TABLE_HEAD)
 
         for language, data in sorted_results:
-            throughput = data.get('Throughput', 0)
-            relative = (throughput / best_throughput * 100) if best_throughput > 0 else 0
-            duration = data.get('Duration', 0)
-            events = data.get('EventCount', 0)
+            throughput = data.Throughput
+            relative = throughput * inv_best
 
-            table_rows.append(f"""
+            parts.append(f"""
                 <tr>
                     <td>{language}</td>
                     <td>{throughput:,.0f}</td>
                     <td>{relative:.1f}%</td>
-                    <td>{duration:.2f}</td>
-                    <td>{events:,}</td>
+                    <td>{data.Duration:.2f}</td>
+                    <td>{data.EventCount:,}</td>
                 </tr>
             """)
 
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>eBPF Benchmark Report</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    margin: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .container {{
-                    max-width: 1000px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 30px;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                h1 {{
-                    color: #333;
-                    border-bottom: 3px solid #007bff;
-                    padding-bottom: 10px;
-                }}
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }}
-                th {{
-                    background-color: #007bff;
-                    color: white;
-                    padding: 12px;
-                    text-align: left;
-                    border: 1px solid #ddd;
-                }}
-                td {{
-                    padding: 10px;
-                    border: 1px solid #ddd;
-                }}
-                tr:nth-child(even) {{
-                    background-color: #f9f9f9;
-                }}
-                .metric {{
-                    background-color: #f0f0f0;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-left: 4px solid #007bff;
-                }}
-                .summary {{
-                    background-color: #e7f3ff;
-                    padding: 15px;
-                    border-radius: 4px;
-                    margin: 20px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>eBPF Benchmark Comparison Report</h1>
-
-                <div class="summary">
-                    <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <p><strong>Languages Tested:</strong> {', '.join([lang for lang, _ in sorted_results])}</p>
-                </div>
-
-                <h2>Results Table</h2>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Language</th>
-                            <th>Throughput (events/sec)</th>
-                            <th>Relative Performance</th>
-                            <th>Duration (sec)</th>
-                            <th>Total Events</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {''.join(table_rows)}
+        parts.append(f"""
                     </tbody>
                 </table>
 
                 <h2>Performance Analysis</h2>
                 <div class="metric">
-                    <p><strong>Best Performance:</strong> {sorted_results[0][0]} with {sorted_results[0][1].get('Throughput', 0):,.0f} events/second</p>
-                    {'<p><strong>Lowest Performance:</strong> ' + sorted_results[-1][0] + ' with ' + f"{sorted_results[-1][1].get('Throughput', 0):,.0f}" + ' events/second</p>' if len(sorted_results) > 1 else ''}
+                    <p><strong>Best Performance:</strong> {summary['best']} with {summary['best_throughput']:,.0f} events/second</p>
+                    """)
+        if len(sorted_results) > 1:
+            parts.append(f"<p><strong>Lowest Performance:</strong> {summary['worst']} with {summary['worst_throughput']:,.0f} events/second</p>")
+        parts.append(f"""
                 </div>
 
                 <h2>Implementation Details</h2>
                 <div class="metric">
                     <ul>
-                        <li><strong>Program Type:</strong> {sorted_results[0][1].get('ProgramType', 'Unknown')}</li>
-                        <li><strong>Data Mechanism:</strong> {sorted_results[0][1].get('DataMechanism', 'Unknown')}</li>
-                        <li><strong>Duration per test:</strong> {sorted_results[0][1].get('Duration', 0):.2f} seconds</li>
+                        <li><strong>Program Type:</strong> {best_data.ProgramType}</li>
+                        <li><strong>Data Mechanism:</strong> {best_data.DataMechanism}</li>
+                        <li><strong>Duration per test:</strong> {best_data.Duration:.2f} seconds</li>
                     </ul>
                 </div>
             </div>
         </body>
         </html>
-        """
+        """)
 
-        return html
+        return "".join(parts)
 
-    def save_reports(self, output_dir: str = "benchmarks/results"):
-        """Save text and HTML reports"""
+    def save_reports(self, output_dir: str = "benchmarks/results", echo: bool = True):
+        """Save text and HTML reports (echoing the text report unless echo=False)"""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Save text report
         text_report = self.generate_text_report()
         text_file = output_path / "report.txt"
-        with open(text_file, 'w') as f:
-            f.write(text_report)
+        text_file.write_text(text_report)
         print(f"✓ Text report saved to {text_file}")
 
         # Print to console
-        print(text_report)
+        if echo:
+            print(text_report)
 
         # Save HTML report
         html_report = self.generate_html_report()
         html_file = output_path / "report.html"
-        with open(html_file, 'w') as f:
-            f.write(html_report)
+        html_file.write_text(html_report)
         print(f"✓ HTML report saved to {html_file}")
 
         return text_file, html_file
@@ -303,19 +515,18 @@ class BenchmarkReport:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Sort by throughput
-        sorted_results = sorted(
-            self.results.items(),
-            key=lambda x: x[1].get('Throughput', 0),
-            reverse=True
-        )
-
-        languages = [lang for lang, _ in sorted_results]
-        throughputs = [data.get('Throughput', 0) for _, data in sorted_results]
-        events = [data.get('EventCount', 0) for _, data in sorted_results]
+        sorted_results = self.sorted_results
+        n = len(sorted_results)
+        languages = [None] * n
+        throughputs = np.empty(n, dtype=np.float64)
+        events = np.empty(n, dtype=np.float64)
+        for i, (language, data) in enumerate(sorted_results):
+            languages[i] = language
+            throughputs[i] = data.Throughput
+            events[i] = data.EventCount
 
         # Create figure with subplots
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        fig, axes = plt.subplots(2, 2, figsize=(12, 10), constrained_layout=True)
         fig.suptitle('eBPF Benchmark Results Comparison', fontsize=16, fontweight='bold')
 
         # Plot 1: Throughput comparison
@@ -327,23 +538,17 @@ class BenchmarkReport:
         ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K'))
 
         # Add value labels on bars
-        for bar, value in zip(bars, throughputs):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{value:,.0f}',
-                   ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, labels=[_FMT_INT(v) for v in throughputs], fontsize=9)
 
         # Plot 2: Relative performance
         ax = axes[0, 1]
-        max_throughput = max(throughputs) if throughputs else 1
-        relative = [(t / max_throughput * 100) for t in throughputs]
+        relative = throughputs * self.inv_best
         bars = ax.barh(languages, relative, color=colors)
         ax.set_xlabel('Relative Performance (%)')
         ax.set_title('Performance Relative to Best')
         ax.set_xlim(0, 110)
 
-        for i, (bar, value) in enumerate(zip(bars, relative)):
-            ax.text(value + 1, i, f'{value:.1f}%', va='center', fontsize=9)
+        ax.bar_label(bars, labels=[_FMT_PCT(v) for v in relative], padding=3, fontsize=9)
 
         # Plot 3: Event count
         ax = axes[1, 0]
@@ -352,54 +557,62 @@ class BenchmarkReport:
         ax.set_title('Total Events Processed')
         ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1e6)}M' if x >= 1e6 else f'{int(x/1e3)}K'))
 
-        for bar, value in zip(bars, events):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{value:,.0f}',
-                   ha='center', va='bottom', fontsize=8, rotation=0)
+        ax.bar_label(bars, labels=[_FMT_INT(v) for v in events], fontsize=8)
 
         # Plot 4: Summary statistics
         ax = axes[1, 1]
         ax.axis('off')
 
         summary_text = "Benchmark Summary\n" + "-"*30 + "\n"
-        summary_text += f"Best: {languages[0]}\n"
-        summary_text += f"Throughput: {throughputs[0]:,.0f} ev/s\n\n"
+        summary = self.summary
+        summary_text += f"Best: {summary['best']}\n"
+        summary_text += f"Throughput: {summary['best_throughput']:,.0f} ev/s\n\n"
 
         if len(languages) > 1:
-            summary_text += f"Worst: {languages[-1]}\n"
-            summary_text += f"Throughput: {throughputs[-1]:,.0f} ev/s\n\n"
+            summary_text += f"Worst: {summary['worst']}\n"
+            summary_text += f"Throughput: {summary['worst_throughput']:,.0f} ev/s\n\n"
 
-        summary_text += f"Average: {np.mean(throughputs):,.0f} ev/s\n"
-        summary_text += f"Median: {np.median(throughputs):,.0f} ev/s"
+        summary_text += f"Average: {summary['mean']:,.0f} ev/s\n"
+        summary_text += f"Median: {summary['median']:,.0f} ev/s"
 
         ax.text(0.1, 0.5, summary_text, fontsize=11, family='monospace',
                verticalalignment='center',
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-        plt.tight_layout()
         plot_file = output_path / "benchmark_comparison.png"
-        plt.savefig(plot_file, dpi=150, bbox_inches='tight')
+        fig.savefig(plot_file, dpi=PLOT_DPI)
         print(f"✓ Plot saved to {plot_file}")
-        plt.close()
+        plt.close(fig)
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Generate benchmark comparison report")
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Write the reports without echoing the text report to stdout"
+    )
+    parser.add_argument(
+        "-a", "--archive",
+        help="Build the report from a run_all_benchmarks archive (e.g. latest.json)"
+    )
+    args = parser.parse_args()
+
     results_dir = "benchmarks/results"
 
     print("\n" + "="*80)
     print("BENCHMARK REPORT GENERATOR")
     print("="*80 + "\n")
 
-    report = BenchmarkReport(results_dir)
+    report = BenchmarkReport(results_dir, archive=args.archive)
 
     if not report.results:
         print("No benchmark results found. Run benchmarks first with: make benchmark")
         sys.exit(1)
 
     # Generate and save reports
-    report.save_reports(results_dir)
+    report.save_reports(results_dir, echo=not args.quiet)
 
     # Create plots if available
     report.create_comparison_plots(results_dir)
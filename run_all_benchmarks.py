@@ -9,48 +9,117 @@ and collects results for comparative analysis.
 import os
 import sys
 import json
+import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The BCC benchmark runs in-process when its module (and bcc) import cleanly
+try:
+    from src.python.ringbuf_throughput import RingBufferBenchmark
+except ImportError:
+    RingBufferBenchmark = None
+
+
+def load_json(path) -> Dict:
+    """Parse a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dump_json(data, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (indented, or compact for archives), using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+# Bytes of a failed benchmark's stderr log quoted in the error summary
+STDERR_TAIL_BYTES = 4096
+
 
 class BenchmarkRunner:
     """Orchestrates benchmark execution across languages"""
 
-    def __init__(self, duration: int = 10, verbose: bool = False, output_dir: str = "benchmarks/results"):
+    def __init__(self, duration: int = 10, verbose: bool = False, output_dir: str = "benchmarks/results",
+                 parallel: bool = False):
         self.duration = duration
         self.verbose = verbose
+        self.parallel = parallel
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.results = []
         self.errors = []
+        self.started_at = None
+
+        # Environment and working directory shared by every benchmark subprocess
+        self._env = os.environ.copy()
+        self._cwd = Path.cwd()
 
     def log(self, msg: str):
         """Print log message with timestamp"""
         if self.verbose:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
 
+    def _run_result_writer(self, cmd: List[str], lang: str, timeout: float):
+        """Run a benchmark binary that writes its own JSON result file.
+
+        stdout is discarded and stderr goes to <lang>_stderr.log in the output
+        directory rather than into memory; verbose runs pass both through to
+        the terminal. Returns the exit code and the tail of the log.
+        """
+        if self.verbose:
+            result = subprocess.run(cmd, timeout=timeout, env=self._env, cwd=self._cwd)
+            return result.returncode, "see output above"
+
+        log_file = self.output_dir / f"{lang}_stderr.log"
+        with open(log_file, 'w+b') as log:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=log, timeout=timeout,
+                                    env=self._env, cwd=self._cwd)
+            log.seek(max(log.tell() - STDERR_TAIL_BYTES, 0))
+            tail = log.read().decode(errors='replace')
+        return result.returncode, tail
+
     def run_python_benchmark(self) -> Optional[Dict]:
         """Run Python (BCC) benchmark"""
         self.log("Starting Python (BCC) Ring Buffer Benchmark...")
 
+        # The benchmark installs a SIGINT handler, which is only possible on
+        # the main thread, so --parallel keeps it in a subprocess
+        if RingBufferBenchmark is not None and not self.parallel:
+            return self._run_python_inprocess()
+
+        result_file = self.output_dir / "python_result.json"
+
         try:
-            # Create a simple Python benchmark script
+            # Create a simple Python benchmark script that writes its own
+            # result file, like the Go and Rust binaries
             script = f"""
 import sys
-sys.path.insert(0, 'src/python')
-from ringbuf_throughput import RingBufferBenchmark
-import json
+from src.python.ringbuf_throughput import RingBufferBenchmark
+from run_all_benchmarks import dump_json
 
 bench = RingBufferBenchmark(verbose={self.verbose})
 try:
     bench.setup()
     bench.run(duration={self.duration})
     results = bench.get_results()
-    print(json.dumps(results, indent=2))
+    with open({str(result_file)!r}, 'wb') as f:
+        f.write(dump_json(results))
 except Exception as e:
     print(f"Error: {{e}}", file=sys.stderr)
     sys.exit(1)
@@ -58,26 +127,20 @@ finally:
     bench.cleanup()
 """
 
-            result = subprocess.run(
-                [sys.executable, "-c", script],
-                capture_output=True,
-                text=True,
-                timeout=self.duration + 30
-            )
+            returncode, stderr = self._run_result_writer([sys.executable, "-c", script], "python", self.duration + 30)
 
-            if result.returncode == 0:
+            if returncode == 0:
+                # Read the JSON result file
                 try:
-                    output_lines = result.stdout.strip().split('\n')
-                    json_str = '\n'.join([l for l in output_lines if l.strip().startswith(('{', '[', '"', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9')) or ':' in l])
-                    data = json.loads(json_str)
+                    data = load_json(result_file)
                     self.log(f"✓ Python benchmark completed: {data.get('throughput', 0):.0f} events/sec")
                     return data
-                except json.JSONDecodeError:
-                    self.log(f"Warning: Could not parse Python output")
+                except Exception as e:
+                    self.log(f"Warning: Could not read Python result: {e}")
                     return None
             else:
-                self.log(f"✗ Python benchmark failed: {result.stderr}")
-                self.errors.append(f"Python: {result.stderr}")
+                self.log(f"✗ Python benchmark failed: {stderr}")
+                self.errors.append(f"Python: {stderr}")
                 return None
 
         except subprocess.TimeoutExpired:
@@ -89,13 +152,30 @@ finally:
             self.errors.append(f"Python: {str(e)}")
             return None
 
+    def _run_python_inprocess(self) -> Optional[Dict]:
+        """Run the BCC benchmark in this interpreter"""
+        bench = RingBufferBenchmark(verbose=self.verbose)
+        try:
+            bench.setup()
+            bench.run(duration=self.duration)
+            data = bench.get_results()
+            self.log(f"✓ Python benchmark completed: {data.get('throughput', 0):.0f} events/sec")
+            return data
+        except Exception as e:
+            self.log(f"✗ Python benchmark error: {e}")
+            self.errors.append(f"Python: {str(e)}")
+            return None
+        finally:
+            bench.cleanup()
+
     def run_go_benchmark(self) -> Optional[Dict]:
         """Run Go (ebpf-go) benchmark"""
         self.log("Starting Go (ebpf-go) Ring Buffer Benchmark...")
 
         try:
             # Check if Go is installed
-            subprocess.run(["go", "version"], capture_output=True, check=True)
+            if shutil.which("go") is None:
+                raise FileNotFoundError("go")
 
             # Build Go benchmark
             build_cmd = ["go", "build", "-o", "build/go_ringbuf", "src/golang/ringbuf_throughput.go", "src/golang/common.go"]
@@ -105,7 +185,9 @@ finally:
                 build_cmd,
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60,
+                env=self._env,
+                cwd=self._cwd
             )
 
             if result.returncode != 0:
@@ -118,26 +200,20 @@ finally:
             if self.verbose:
                 run_cmd.append("-v")
 
-            result = subprocess.run(
-                run_cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.duration + 30
-            )
+            returncode, stderr = self._run_result_writer(run_cmd, "go", self.duration + 30)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 # Read the JSON result file
                 try:
-                    with open(f"{self.output_dir}/go_result.json", "r") as f:
-                        data = json.load(f)
+                    data = load_json(f"{self.output_dir}/go_result.json")
                     self.log(f"✓ Go benchmark completed: {data.get('Throughput', 0):.0f} events/sec")
                     return data
                 except Exception as e:
                     self.log(f"Warning: Could not read Go result: {e}")
                     return None
             else:
-                self.log(f"✗ Go benchmark failed: {result.stderr}")
-                self.errors.append(f"Go: {result.stderr}")
+                self.log(f"✗ Go benchmark failed: {stderr}")
+                self.errors.append(f"Go: {stderr}")
                 return None
 
         except FileNotFoundError:
@@ -159,7 +235,9 @@ finally:
 
         try:
             # Check if Rust is installed
-            subprocess.run(["rustc", "--version"], capture_output=True, check=True)
+            for tool in ("rustc", "cargo"):
+                if shutil.which(tool) is None:
+                    raise FileNotFoundError(tool)
 
             # Build Rust userspace
             build_cmd = ["cargo", "build", "--release", "--manifest-path", "src/rust/userspace/Cargo.toml"]
@@ -170,7 +248,8 @@ finally:
                 capture_output=True,
                 text=True,
                 timeout=120,
-                cwd="."
+                env=self._env,
+                cwd=self._cwd
             )
 
             if result.returncode != 0:
@@ -187,27 +266,20 @@ finally:
             if self.verbose:
                 run_cmd.append("--verbose")
 
-            result = subprocess.run(
-                run_cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.duration + 60,
-                cwd="."
-            )
+            returncode, stderr = self._run_result_writer(run_cmd, "rust", self.duration + 60)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 # Read the JSON result file
                 try:
-                    with open(f"{self.output_dir}/rust_result.json", "r") as f:
-                        data = json.load(f)
+                    data = load_json(f"{self.output_dir}/rust_result.json")
                     self.log(f"✓ Rust benchmark completed: {data.get('throughput', 0):.0f} events/sec")
                     return data
                 except Exception as e:
                     self.log(f"Warning: Could not read Rust result: {e}")
                     return None
             else:
-                self.log(f"✗ Rust benchmark failed: {result.stderr}")
-                self.errors.append(f"Rust: {result.stderr}")
+                self.log(f"✗ Rust benchmark failed: {stderr}")
+                self.errors.append(f"Rust: {stderr}")
                 return None
 
         except FileNotFoundError:
@@ -229,7 +301,9 @@ finally:
 
         try:
             # Check if clang is installed
-            subprocess.run(["clang", "--version"], capture_output=True, check=True)
+            for tool in ("clang", "make"):
+                if shutil.which(tool) is None:
+                    raise FileNotFoundError(tool)
 
             # Build C programs
             self.log("Building C eBPF programs...")
@@ -237,7 +311,9 @@ finally:
                 ["make", "build-c"],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60,
+                env=self._env,
+                cwd=self._cwd
             )
 
             if result.returncode != 0:
@@ -281,8 +357,9 @@ finally:
         print(f"Output directory: {self.output_dir}")
         print("="*70 + "\n")
 
+        self.started_at = datetime.now()
         all_results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self.started_at.isoformat(),
             "duration": self.duration,
             "results": {}
         }
@@ -295,37 +372,63 @@ finally:
             ("Rust", self.run_rust_benchmark),
         ]
 
-        for lang_name, bench_func in benchmarks:
-            print(f"\n[*] {lang_name} Benchmark")
-            print("-" * 70)
-
-            start_time = time.time()
-            result = bench_func()
-            elapsed = time.time() - start_time
-
-            if result:
-                all_results["results"][lang_name] = result
-                print(f"[+] Completed in {elapsed:.1f}s")
-            else:
-                all_results["results"][lang_name] = {"status": "failed", "error": "See logs"}
-                print(f"[-] Failed")
+        if self.parallel:
+            # Benchmarks block on their subprocesses, so threads overlap them
+            # fully; results are reported as they finish
+            with ThreadPoolExecutor(max_workers=len(benchmarks)) as ex:
+                futures = {ex.submit(self._run_timed, bench_func): lang_name
+                           for lang_name, bench_func in benchmarks}
+                for fut in as_completed(futures):
+                    lang_name = futures[fut]
+                    print(f"\n[*] {lang_name} Benchmark")
+                    print("-" * 70)
+                    self._report(all_results, lang_name, *fut.result())
+
+            # Keep the declared language order in the saved results
+            all_results["results"] = {
+                lang_name: all_results["results"][lang_name] for lang_name, _ in benchmarks
+            }
+        else:
+            for lang_name, bench_func in benchmarks:
+                print(f"\n[*] {lang_name} Benchmark")
+                print("-" * 70)
+                self._report(all_results, lang_name, *self._run_timed(bench_func))
 
         return all_results
 
+    @staticmethod
+    def _run_timed(bench_func):
+        """Run one benchmark, returning its result and elapsed seconds"""
+        start_time = time.time()
+        result = bench_func()
+        return result, time.time() - start_time
+
+    @staticmethod
+    def _report(all_results: Dict, lang_name: str, result: Optional[Dict], elapsed: float):
+        """Record one benchmark result and print its outcome"""
+        if result:
+            all_results["results"][lang_name] = result
+            print(f"[+] Completed in {elapsed:.1f}s")
+        else:
+            all_results["results"][lang_name] = {"status": "failed", "error": "See logs"}
+            print(f"[-] Failed")
+
     def save_results(self, results: Dict):
         """Save aggregated results to JSON"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Name the archive after the run's start so it matches the embedded timestamp
+        timestamp = (self.started_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
         output_file = self.output_dir / f"benchmark_results_{timestamp}.json"
 
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # The timestamped archive is compact; latest.json stays indented for reading
+        with open(output_file, 'wb') as f:
+            f.write(dump_json(results, indent=False))
 
         self.log(f"Results saved to {output_file}")
 
         # Also save to latest.json
         latest_file = self.output_dir / "latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(latest_file, 'wb') as f:
+            f.write(dump_json(results))
 
         return output_file
 
@@ -377,13 +480,19 @@ def main():
         action="store_true",
         help="Verbose output"
     )
+    parser.add_argument(
+        "-p", "--parallel",
+        action="store_true",
+        help="Run the language benchmarks concurrently (CPU figures may interfere)"
+    )
 
     args = parser.parse_args()
 
     runner = BenchmarkRunner(
         duration=args.duration,
         verbose=args.verbose,
-        output_dir=args.output
+        output_dir=args.output,
+        parallel=args.parallel
     )
 
     results = runner.run_all_benchmarks()
@@ -147,7 +147,7 @@ run_benchmarks() {
 
             echo ''
             echo 'Generating reports...'
-            python3 generate_benchmark_report.py
+            python3 generate_benchmark_report.py -q
         " || {
         error "Benchmark execution failed"
     }
@@ -152,7 +152,7 @@ generate_reports() {
     log "Creating text and HTML reports..."
 
     cd "$PROJECT_ROOT"
-    python3 generate_benchmark_report.py
+    python3 generate_benchmark_report.py -q
 
     success "Reports generated:"
     success "  - Text report: $RESULTS_DIR/report.txt"
@@ -5,13 +5,19 @@ Common utilities for Python eBPF benchmarks
 Provides shared definitions and helper functions for BCC-based programs
 """
 
-from ctypes import Structure, c_uint64, c_uint32, c_char
+from ctypes import Structure, c_uint64, c_uint32, c_char, memmove, addressof, sizeof
+import atexit
+import os
+import struct
+import sys
 import time
-from enum import IntEnum
+from functools import lru_cache
+
+import numpy as np
 
 # Event types
-class EventType(IntEnum):
-    """eBPF event types"""
+class EventType:
+    """eBPF event types (plain ints, matching the literals in the BPF programs)"""
     KPROBE = 1
     TRACEPOINT = 2
     UPROBE = 3
@@ -30,6 +36,22 @@ class Event(Structure):
     ]
 
 
+# NumPy layout of struct event, used for the collector's column store
+EVENT_DTYPE = np.dtype([
+    ('timestamp', '<u8'),
+    ('pid', '<u4'),
+    ('cpu_id', '<u4'),
+    ('event_type', '<u4'),
+    ('data', '<u4'),
+])
+EVENT_SIZE = sizeof(Event)
+assert EVENT_DTYPE.itemsize == EVENT_SIZE
+
+# Precompiled decoder for struct event held in bytes-like buffers
+_EVENT_STRUCT = struct.Struct('<QIIII')
+assert _EVENT_STRUCT.size == EVENT_SIZE
+
+
 class LatencyEvent(Structure):
     """Event structure for latency measurement"""
     _fields_ = [
@@ -50,11 +72,10 @@ class Stats(Structure):
     ]
 
 
+@lru_cache(maxsize=1)
 def get_kernel_version():
     """Get current kernel version as tuple"""
-    import subprocess
-    version_str = subprocess.check_output(['uname', '-r']).decode().strip()
-    parts = version_str.split('.')
+    parts = os.uname().release.split('.')
     try:
         return (int(parts[0]), int(parts[1]))
     except (ValueError, IndexError):
@@ -78,61 +99,210 @@ def check_kernel_capability(feature):
     return kernel_ver >= required_ver
 
 
+# Ways EventCollector can keep events: only count them, keep every
+# SAMPLE_EVERY-th record, or keep every record
+COLLECT_MODES = ('count', 'sample', 'all')
+
+# Reads the cpu_id field of a raw record without copying the record
+_CPU_ID_OFFSET = Event.cpu_id.offset
+
+
 class EventCollector:
-    """Helper class for collecting events from ring/perf buffers"""
+    """Helper class for collecting events from ring/perf buffers.
+
+    Every event is counted in ``n``. Depending on ``mode``, records are also
+    copied into a preallocated structured array (EVENT_DTYPE), of which only
+    the first ``rows`` rows are valid.
+    """
+
+    # Event slots allocated when no expected count is given; the store
+    # doubles if a run overflows it
+    DEFAULT_CAPACITY = 1 << 16
 
-    def __init__(self):
-        self.events = []
+    # Stored fraction of records in 'sample' mode
+    SAMPLE_EVERY = 1000
+
+    def __init__(self, expected_events=DEFAULT_CAPACITY, mode='all'):
+        if mode not in COLLECT_MODES:
+            raise ValueError(f"Unknown collect mode {mode!r}, expected one of {COLLECT_MODES}")
+
+        self.mode = mode
+        # Bind the per-record handler once so the hot path never branches on mode
+        self.add_record = getattr(self, f"_{mode}_record")
+        self._cpu_ids = set()
+        self._allocate(self._rows_for(expected_events))
+        self.n = 0
         self.start_time = None
         self.end_time = None
+        self.duration = 0
+        self.throughput = 0
 
-    def start_collection(self):
-        """Mark start of event collection"""
-        self.start_time = time.time()
-        self.events = []
+    def _rows_for(self, expected_events):
+        """Rows needed to store expected_events in the current mode"""
+        if self.mode == 'all':
+            return expected_events
+        if self.mode == 'sample':
+            return expected_events // self.SAMPLE_EVERY + 1
+        return 0
+
+    def _allocate(self, capacity):
+        """Replace the event store with an empty one of the given capacity"""
+        self.events = np.empty(capacity, dtype=EVENT_DTYPE)
+        self._base = self.events.ctypes.data
+        self._capacity = capacity
+        self.rows = 0
+
+    def start_collection(self, expected_events=None):
+        """Mark start of event collection, presizing the store for expected_events"""
+        if expected_events is not None:
+            rows = self._rows_for(expected_events)
+            if rows > self._capacity:
+                self._allocate(rows)
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self.duration = 0
+        self.throughput = 0
+        self.n = 0
+        self.rows = 0
+        self._cpu_ids.clear()
 
     def end_collection(self):
-        """Mark end of event collection"""
-        self.end_time = time.time()
+        """Mark end of event collection and fix duration and throughput"""
+        self.end_time = time.monotonic()
+        self.duration = self.end_time - self.start_time
+        self.throughput = self.n / self.duration if self.duration > 0 else 0
+
+    def _grow(self):
+        """Double the capacity of the event store"""
+        self._capacity = max(1, 2 * self._capacity)
+        self.events = np.resize(self.events, self._capacity)
+        self._base = self.events.ctypes.data
+
+    def _store(self, data):
+        """Copy the record at address data into the next row"""
+        rows = self.rows
+        if rows == self._capacity:
+            self._grow()
+        memmove(self._base + rows * EVENT_SIZE, data, EVENT_SIZE)
+        self.rows = rows + 1
+
+    # add_record(data) is one of the three handlers below, chosen by mode.
+    # They take the address of a raw record: the ring buffer hot path, with
+    # no Python object kept per record.
+
+    def _count_record(self, data):
+        self._cpu_ids.add(c_uint32.from_address(data + _CPU_ID_OFFSET).value)
+        self.n += 1
+
+    def _sample_record(self, data):
+        n = self.n
+        self._cpu_ids.add(c_uint32.from_address(data + _CPU_ID_OFFSET).value)
+        if n % self.SAMPLE_EVERY == 0:
+            self._store(data)
+        self.n = n + 1
+
+    def _all_record(self, data):
+        rows = self.rows
+        if rows == self._capacity:
+            self._grow()
+        memmove(self._base + rows * EVENT_SIZE, data, EVENT_SIZE)
+        self.rows = rows + 1
+        self.n += 1
+
+    def add_records(self, data, count):
+        """Add count consecutive records starting at address data"""
+        if self.mode != 'all':
+            add = self.add_record
+            for i in range(count):
+                add(data + i * EVENT_SIZE)
+            return
+
+        rows = self.rows
+        while rows + count > self._capacity:
+            self._grow()
+        memmove(self._base + rows * EVENT_SIZE, data, count * EVENT_SIZE)
+        self.rows = rows + count
+        self.n += count
 
     def add_event(self, event_data):
-        """Add event to collection"""
-        if isinstance(event_data, bytes):
-            event = Event.from_buffer_copy(event_data)
-        else:
-            event = event_data
-        self.events.append(event)
+        """Add event to collection (a record address, a buffer, or an Event)"""
+        if isinstance(event_data, int):
+            self.add_record(event_data)
+            return
+
+        # Keep the Event alive while its address is used
+        event = event_data if isinstance(event_data, Event) else event_view(event_data)
+        self.add_record(addressof(event))
 
     def get_duration(self):
-        """Get collection duration in seconds"""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
-        return 0
+        """Get collection duration in seconds (0 until end_collection)"""
+        return self.duration
 
     def get_event_count(self):
         """Get total number of events collected"""
-        return len(self.events)
+        return self.n
 
     def get_throughput(self):
-        """Get events per second"""
-        duration = self.get_duration()
-        if duration > 0:
-            return self.get_event_count() / duration
-        return 0
+        """Get events per second (0 until end_collection)"""
+        return self.throughput
 
     def get_cpu_ids(self):
         """Get set of CPUs that generated events"""
-        return set(e.cpu_id for e in self.events if hasattr(e, 'cpu_id'))
+        if self.mode != 'all':
+            return set(self._cpu_ids)
+
+        # CPU ids are small integers, so one counting pass over the column
+        # finds them without sorting; only the distinct ids become Python ints
+        return set(np.flatnonzero(np.bincount(self.events['cpu_id'][:self.rows])).tolist())
 
     def get_events_by_pid(self, pid=None):
-        """Get events filtered by PID"""
+        """Get stored events filtered by PID"""
+        events = self.events[:self.rows]
         if pid is None:
-            return self.events
-        return [e for e in self.events if e.pid == pid]
+            return events
+        return events[events['pid'] == pid]
+
+
+def event_view(data):
+    """Zero-copy Event over a record address or writable buffer (copies read-only ones)"""
+    if isinstance(data, int):
+        return Event.from_address(data)
+    if isinstance(data, bytes) or (isinstance(data, memoryview) and data.readonly):
+        return Event.from_buffer_copy(data)
+    return Event.from_buffer(data)
+
+
+# print_event output is staged here and written to fd 1 in chunks of
+# about _OUT_CHUNK bytes rather than one write per event
+_out_buf = bytearray()
+_OUT_CHUNK = 1 << 16
+
+
+def flush_events():
+    """Write out events buffered by print_event"""
+    if not _out_buf:
+        return
+    # Keep ordering with anything already printed through sys.stdout
+    sys.stdout.flush()
+    view = memoryview(_out_buf)
+    while view:
+        view = view[os.write(1, view):]
+    view.release()
+    del _out_buf[:]
+
+
+atexit.register(flush_events)
 
 
 def print_event(cpu, data, size):
-    """Print callback for ring buffer events"""
-    event = Event.from_buffer_copy(data)
-    print(f"CPU {event.cpu_id}: PID {event.pid} Event {event.event_type} Data {event.data}")
+    """Print callback for ring buffer events (buffered, see flush_events)"""
+    if isinstance(data, int):
+        event = Event.from_address(data)
+        pid, cpu_id, event_type, value = event.pid, event.cpu_id, event.event_type, event.data
+    else:
+        # Unpacking a buffer is cheaper than building an Event copy of it
+        _, pid, cpu_id, event_type, value = _EVENT_STRUCT.unpack_from(data)
+    _out_buf.extend(b"CPU %d: PID %d Event %d Data %d\n" % (cpu_id, pid, event_type, value))
+    if len(_out_buf) > _OUT_CHUNK:
+        flush_events()
     return 0
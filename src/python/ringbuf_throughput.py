@@ -6,12 +6,13 @@ Traces syscalls and records events to ring buffer for throughput measurement.
 """
 
 from bcc import BPF
-import ctypes as ct
 import argparse
+from ctypes import addressof
+import os
 import time
 import signal
 import sys
-from .common import Event, EventCollector, check_kernel_capability
+from .common import COLLECT_MODES, EVENT_SIZE, EventCollector, check_kernel_capability
 
 
 class RingBufferBenchmark:
@@ -30,40 +31,114 @@ class RingBufferBenchmark:
         u32 data;
     };
 
-    BPF_RINGBUF_OUTPUT(ringbuf_events, 256);
+    BPF_RINGBUF_OUTPUT(ringbuf_events, RINGBUF_PAGES);
 
-    BPF_ARRAY(counters, u64, 10);
+    #ifdef FILTER_PIDS
+    BPF_HASH(target_pids, u32, u8, MAX_TARGET_PIDS);
+    #endif
+
+    #ifdef BATCH_EVENTS
+    // Events staged per CPU and written to the ring BATCH_EVENTS at a time
+    struct batch {
+        u32 n;
+        struct event ev[BATCH_EVENTS];
+    };
+    BPF_PERCPU_ARRAY(stage, struct batch, 1);
+    #endif
 
     int kprobe__do_sys_openat2(struct pt_regs *ctx)
     {
         struct event *e;
+        u32 pid = bpf_get_current_pid_tgid() >> 32;
+
+    #ifdef FILTER_PIDS
+        // Drop other processes before touching the ring buffer
+        if (!target_pids.lookup(&pid))
+            return 0;
+    #endif
 
+    #ifdef BATCH_EVENTS
+        u32 zero = 0;
+        struct batch *b = stage.lookup(&zero);
+        if (!b)
+            return 0;
+
+        u32 i = b->n;
+        if (i >= BATCH_EVENTS)
+            i = 0;
+        e = &b->ev[i];
+    #else
         e = ringbuf_events.ringbuf_reserve(sizeof(*e));
         if (!e)
             return 1;
+    #endif
 
         e->timestamp = bpf_ktime_get_ns();
-        e->pid = bpf_get_current_uid_gid() >> 32;
+        e->pid = pid;
         e->cpu_id = bpf_get_smp_processor_id();
         e->event_type = 1;  // KPROBE
         e->data = PT_REGS_PARM1(ctx);
 
+    #ifdef BATCH_EVENTS
+        if (++i == BATCH_EVENTS) {
+            // One copy into the ring for the whole batch; a full ring drops it
+            ringbuf_events.ringbuf_output(b->ev, sizeof(b->ev), 0);
+            i = 0;
+        }
+        b->n = i;
+    #else
         ringbuf_events.ringbuf_submit(e, 0);
-
-        u32 zero = 0;
-        u64 *counter = counters.lookup(&zero);
-        if (counter)
-            __sync_fetch_and_add(counter, 1);
+    #endif
 
         return 0;
     }
     """
 
-    def __init__(self, verbose=False):
-        """Initialize the benchmark"""
+    # Ring buffer size in pages (64 MiB). Must be a power of two; larger
+    # buffers absorb longer bursts but cost memory and cache locality.
+    DEFAULT_RINGBUF_PAGES = 16384
+
+    # Size of the in-kernel PID filter map
+    MAX_TARGET_PIDS = 64
+
+    # Event rate used to presize the collector for a run (events/sec)
+    EXPECTED_EVENT_RATE = 100_000
+
+    # Upper bound on one epoll wait, so duration and SIGINT are checked regularly
+    POLL_TIMEOUT_MS = 100
+
+    def __init__(self, verbose=False, consumer_cpu=None, ringbuf_pages=DEFAULT_RINGBUF_PAGES,
+                 collect_mode='count', pids=None, batch_events=0):
+        """Initialize the benchmark.
+
+        consumer_cpu pins the consuming thread for the run; None picks the
+        last CPU this process may use, and a negative value disables pinning.
+        ringbuf_pages sizes the ring buffer and must be a power of two.
+        collect_mode selects what the collector keeps per event (see
+        COLLECT_MODES); 'count' only counts events and the CPUs they ran on.
+        pids restricts tracing to those processes, filtered in the kprobe.
+        batch_events > 0 stages that many events per CPU in the kernel and
+        submits them with one ring buffer write; 0 submits each event.
+        """
+        if ringbuf_pages <= 0 or ringbuf_pages & (ringbuf_pages - 1):
+            raise ValueError(f"ringbuf_pages must be a power of two, got {ringbuf_pages}")
+        if batch_events < 0:
+            raise ValueError(f"batch_events must not be negative, got {batch_events}")
+        if consumer_cpu is not None and consumer_cpu >= 0:
+            allowed = os.sched_getaffinity(0)
+            if consumer_cpu not in allowed:
+                raise ValueError(f"consumer_cpu {consumer_cpu} is not available to this process "
+                                 f"(allowed CPUs: {sorted(allowed)})")
+        if pids and len(set(pids)) > self.MAX_TARGET_PIDS:
+            raise ValueError(f"At most {self.MAX_TARGET_PIDS} PIDs can be traced, got {len(set(pids))}")
+
         self.verbose = verbose
+        self.consumer_cpu = consumer_cpu
+        self.ringbuf_pages = ringbuf_pages
+        self.pids = sorted(set(pids)) if pids else []
+        self.batch_events = batch_events
         self.bpf = None
-        self.collector = EventCollector()
+        self.collector = EventCollector(mode=collect_mode)
         self.running = False
         self.lost_events = 0
 
@@ -78,16 +153,33 @@ class RingBufferBenchmark:
         if self.verbose:
             print("Loading eBPF program...")
 
-        # Compile and load BPF program
-        self.bpf = BPF(text=self.BPF_PROGRAM)
+        # Compile and load BPF program; the PID filter is only compiled in
+        # when requested, so unfiltered runs pay no map lookup
+        cflags = [f"-DRINGBUF_PAGES={self.ringbuf_pages}"]
+        if self.pids:
+            cflags += ["-DFILTER_PIDS", f"-DMAX_TARGET_PIDS={self.MAX_TARGET_PIDS}"]
+        if self.batch_events:
+            cflags.append(f"-DBATCH_EVENTS={self.batch_events}")
+        self.bpf = BPF(text=self.BPF_PROGRAM, cflags=cflags)
+
+        if self.pids:
+            target_pids = self.bpf["target_pids"]
+            for pid in self.pids:
+                target_pids[target_pids.Key(pid)] = target_pids.Leaf(1)
 
         if self.verbose:
             print("✓ eBPF program loaded")
 
-    def handle_event(self, cpu, data, size):
+    def handle_event(self, ctx, data, size):
         """Handle ring buffer event"""
-        event = ct.cast(data, ct.POINTER(Event)).contents
-        self.collector.add_event(event)
+        # The record is only valid during the callback; the collector reads
+        # or copies it straight from the ring without building an Event
+        self.collector.add_record(data)
+        return 0
+
+    def handle_batch(self, ctx, data, size):
+        """Handle a ring buffer record holding a batch of events"""
+        self.collector.add_records(data, size // EVENT_SIZE)
         return 0
 
     def handle_lost_events(self, lost_count):
@@ -105,8 +197,24 @@ class RingBufferBenchmark:
             print(f"Running benchmark for {duration} seconds...")
 
         self.setup_ringbuf()
+        pinned = self._pin_consumer()
+        # _consume() installs its own SIGINT handler; the caller's comes back
+        # afterwards (run_all_benchmarks runs this in-process)
+        old_sigint = signal.getsignal(signal.SIGINT)
+        try:
+            self._consume(duration)
+        finally:
+            signal.signal(signal.SIGINT, old_sigint)
+            # Never leave the process pinned under SCHED_FIFO
+            self._unpin_consumer(pinned)
+
+        if self.verbose:
+            print("✓ Benchmark complete")
+
+    def _consume(self, duration):
+        """Drain the ring buffer into the collector for duration seconds"""
         self.running = True
-        self.collector.start_collection()
+        self.collector.start_collection(expected_events=int(duration * self.EXPECTED_EVENT_RATE))
 
         # Set up signal handler for graceful shutdown
         def signal_handler(sig, frame):
@@ -114,57 +222,103 @@ class RingBufferBenchmark:
 
         signal.signal(signal.SIGINT, signal_handler)
 
+        collector = self.collector
         try:
-            start_time = time.time()
-            while time.time() - start_time < duration and self.running:
+            deadline = time.monotonic_ns() + int(duration * 1_000_000_000)
+            idle = True
+            while self.running:
+                remaining_ms = (deadline - time.monotonic_ns()) // 1_000_000
+                if remaining_ms <= 0:
+                    break
                 try:
-                    # Ring buffer is callback-based, just sleep briefly
-                    # Events are processed by the callback installed in setup_ringbuf()
-                    time.sleep(0.01)
+                    before = collector.n
+                    if idle:
+                        # Block in epoll until the kernel signals data; the
+                        # callback installed in setup_ringbuf() handles each record
+                        self.bpf.ring_buffer_poll(timeout=min(self.POLL_TIMEOUT_MS, remaining_ms))
+                    else:
+                        # The last pass found records: keep draining without
+                        # an epoll_wait until a pass comes back empty
+                        self.bpf.ring_buffer_consume()
+                    idle = collector.n == before
                 except KeyboardInterrupt:
                     self.running = False
                     break
+
+            # Pick up records submitted since the last wake-up
+            self.bpf.ring_buffer_consume()
+            if self.batch_events:
+                self._drain_stage()
         except Exception as e:
             print(f"Error during benchmark: {e}")
             self.running = False
 
         self.collector.end_collection()
 
+    def _drain_stage(self):
+        """Collect the events left in partly filled per-CPU batches"""
+        stage = self.bpf["stage"]
+        for batch in stage.getvalue(stage.Key(0)):
+            count = min(batch.n, self.batch_events)
+            if count:
+                self.collector.add_records(addressof(batch.ev), count)
+
+    def _pin_consumer(self):
+        """Pin the consumer to one CPU (and SCHED_FIFO if permitted).
+
+        Returns the previous affinity and scheduling policy for _unpin_consumer().
+        """
+        if self.consumer_cpu is not None and self.consumer_cpu < 0:
+            return None
+
+        affinity = os.sched_getaffinity(0)
+        cpu = max(affinity) if self.consumer_cpu is None else self.consumer_cpu
+        policy = os.sched_getscheduler(0)
+        param = os.sched_getparam(0)
+
+        os.sched_setaffinity(0, {cpu})
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+        except PermissionError:
+            pass  # needs CAP_SYS_NICE; pinning alone still applies
+
         if self.verbose:
-            print("✓ Benchmark complete")
+            print(f"Consumer pinned to CPU {cpu}")
+        return affinity, policy, param
+
+    @staticmethod
+    def _unpin_consumer(pinned):
+        """Restore the affinity and scheduling policy saved by _pin_consumer()"""
+        if pinned is None:
+            return
+
+        affinity, policy, param = pinned
+        os.sched_setscheduler(0, policy, param)
+        os.sched_setaffinity(0, affinity)
 
     def setup_ringbuf(self):
         """Set up ring buffer event handling"""
-        # For BCC, ring buffers work differently - we'll just read the counter
-        # The ring buffer macro BPF_RINGBUF_OUTPUT doesn't have direct Python support
-        # So we'll track events via the counter map instead
-        pass
+        # BCC ring buffers have no lost-event callback: a full buffer makes
+        # ringbuf_reserve() fail in the kernel, so those events are never counted
+        callback = self.handle_batch if self.batch_events else self.handle_event
+        self.bpf["ringbuf_events"].open_ring_buffer(callback)
 
     def get_results(self):
         """Get benchmark results"""
-        # Read event count from the eBPF counter map
-        event_count = 0
-        try:
-            counters = self.bpf["counters"]
-            zero = ct.c_uint32(0)
-            # Read the counter value from the map
-            counter_value = counters[zero]
-            if counter_value:
-                event_count = int(counter_value.value)
-        except Exception as e:
-            if self.verbose:
-                print(f"Warning: Could not read counter: {e}")
+        # Every submitted record is drained into the collector, which
+        # counts it whether or not the record is stored
+        event_count = self.collector.get_event_count()
 
-        # Calculate duration and throughput
+        # Fixed by the collector when the run ended
         duration = self.collector.get_duration()
-        throughput = event_count / duration if duration > 0 else 0
+        throughput = self.collector.get_throughput()
 
         return {
             'event_count': event_count,
             'throughput': throughput,
             'duration': duration,
             'lost_events': self.lost_events,
-            'cpu_ids': [],
+            'cpu_ids': sorted(self.collector.get_cpu_ids()),
         }
 
     def print_results(self):
@@ -200,11 +354,50 @@ def main():
         action='store_true',
         help='Verbose output'
     )
+    parser.add_argument(
+        '--ringbuf-pages',
+        type=int,
+        default=RingBufferBenchmark.DEFAULT_RINGBUF_PAGES,
+        help='Ring buffer size in pages, a power of two (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--consumer-cpu',
+        type=int,
+        default=None,
+        help='CPU to pin the consumer to (default: last usable CPU, -1: no pinning)'
+    )
+    parser.add_argument(
+        '-p', '--pid',
+        type=int,
+        action='append',
+        help='Only trace this PID (repeatable, filtered in the kernel)'
+    )
+    parser.add_argument(
+        '--batch',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Stage N events per CPU in the kernel and submit them together; partly '
+             'filled batches are collected when the run ends (default: 0, off)'
+    )
+    parser.add_argument(
+        '--collect-mode',
+        choices=COLLECT_MODES,
+        default='count',
+        help='Events kept by the consumer: count only, every 1000th, or all (default: %(default)s)'
+    )
 
     args = parser.parse_args()
 
     try:
-        bench = RingBufferBenchmark(verbose=args.verbose)
+        bench = RingBufferBenchmark(
+            verbose=args.verbose,
+            consumer_cpu=args.consumer_cpu,
+            ringbuf_pages=args.ringbuf_pages,
+            collect_mode=args.collect_mode,
+            pids=args.pid,
+            batch_events=args.batch
+        )
         bench.setup()
         bench.run(duration=args.duration)
         bench.print_results()